@@ -29,37 +29,55 @@ import clingo
 
 from caspo import core
 
-def __learn_io__(networks, setup, configure):
+def __learn_io__(networks, setup, configure, distinct=0, reduced=False):
     encoding = os.path.join(os.path.dirname(__file__), 'encodings/classify/io.lp')
-    setup_fs = setup.to_funset()
 
-    behaviors = core.LogicalNetworkList.from_hypergraph(networks.hg)
-    for rep in networks:
+    # the setup and all networks are grounded once, each pair of networks is then compared by
+    # selecting both of them through the external atoms selected/1
+    solver = clingo.Control()
+    if configure is not None:
+        configure(solver.configuration)
+
+    core.Instance(setup.to_funset().union(networks.to_funset())).load(solver)
+    solver.load(encoding)
+    solver.ground([("base", [])])
+
+    selected = [clingo.Function('selected', [clingo.Number(i)]) for i in range(len(networks))]
+
+    # the first networks are known to have pairwise different behaviors. If the remaining networks
+    # are reduced as well, they are only compared against the first ones
+    representatives = list(range(distinct))
+    behaviors = networks[representatives]
+    for i, rep in enumerate(networks[range(distinct, len(networks))], distinct):
         found = False
-        nlist = core.LogicalNetworkList.from_hypergraph(networks.hg, [rep])
-        for i, behavior in enumerate(behaviors):
-            blist = core.LogicalNetworkList.from_hypergraph(networks.hg, [behavior])
-            fs = setup_fs.union(nlist.concat(blist).to_funset())
-            instance = ". ".join(map(str, fs)) + "."
-
-            solver = clingo.Control()
-            if configure is not None:
-                configure(solver.configuration)
-
-            solver.add("base", [], instance)
-            solver.load(encoding)
-
-            solver.ground([("base", [])])
-            if solver.solve().unsatisfiable:
-                found = True
-                behaviors.add_network(i, rep)
+        solver.assign_external(selected[i], True)
+        for k, j in enumerate(representatives[:distinct] if reduced else representatives):
+            solver.assign_external(selected[j], True)
+            found = solver.solve().unsatisfiable
+            solver.assign_external(selected[j], False)
+
+            if found:
+                behaviors.add_network(k, rep)
                 break
 
+        if found or reduced:
+            # the network is never selected again, thus the solver can simplify its rules away
+            solver.release_external(selected[i])
+        else:
+            solver.assign_external(selected[i], False)
+
         if not found:
+            representatives.append(i)
             behaviors.append(rep)
 
     return behaviors
 
+def __merge_io__(left, right, setup, configure):
+    return __learn_io__(left.concat(right), setup, configure, len(left), True)
+
+def __hash_io__(networks, setup, n_jobs):
+    return networks.unique(networks.signatures(setup, n_jobs))
+
 class Classifier(object):
     """
     Classifier of given list of logical networks with respect to a given experimental setup.
@@ -90,9 +108,13 @@ class Classifier(object):
 
         self._logger = logging.getLogger("caspo")
 
-    def classify(self, n_jobs=-1, configure=None):
+    def classify(self, n_jobs=-1, configure=None, max_cues=20, behaviors=None):
         """
-        Returns input-output behaviors for the list of logical networks in the attribute :attr:`networks`
+        Returns input-output behaviors for the list of logical networks in the attribute
+        :attr:`networks`. If the experimental setup has at most `max_cues` cues, all networks are
+        simulated for every possible clamping and grouped by the digest of their predictions in a
+        single pass. Otherwise, each network is compared with clingo against every behavior found
+        so far.
 
         Example::
 
@@ -106,34 +128,80 @@ class Classifier(object):
 
             >>> behaviors.to_csv('behaviors.csv', networks=True)
 
+        Previously found behaviors can be updated with new networks only::
+
+            >>> known = core.LogicalNetworkList.from_csv('behaviors.csv')
+            >>> behaviors = classify.Classifier(more_networks, setup).classify(behaviors=known)
+
         n_jobs : int
             Number of jobs to run in parallel. Default to -1 (all cores available)
 
         configure : callable
             Callable object responsible of setting clingo configuration
 
+        max_cues : int
+            Maximum number of cues (stimuli and inhibitors) in the setup to classify by simulation
+
+        behaviors : Optional[:class:`caspo.core.logicalnetwork.LogicalNetworkList`]
+            Known input-output behaviors (with pairwise different behaviors) over the same mappings,
+            in any order, e.g., read from a previous `behaviors.csv` with the number of networks for
+            each behavior. If given, networks in the attribute :attr:`networks` are classified
+            against them: weights of matching behaviors are updated and new behaviors are appended
+
 
         Returns
         -------
         caspo.core.logicalnetwork.LogicalNetworkList
             The list of networks with one representative for each behavior
+
+        Raises
+        ------
+        ValueError
+            If the known behaviors are given over different logical mappings
         """
         start = timeit.default_timer()
         networks = self.networks
 
-        n = len(networks)
-        cpu = n_jobs if n_jobs > -1 else mp.cpu_count()
-
-        if cpu > 1:
-            lpart = int(np.ceil(n / float(cpu))) if n > cpu else 1
-            parts = networks.split(np.arange(lpart, n, lpart))
-
-            behaviors_parts = Parallel(n_jobs=n_jobs)(delayed(__learn_io__)(part, self.setup, configure) for part in parts)
-            networks = core.LogicalNetworkList.from_hypergraph(networks.hg)
-            for behavior in behaviors_parts:
-                networks = networks.concat(behavior)
+        # mappings of networks learned in different runs may be in a different order
+        known = behaviors
+        if known is not None:
+            if set(known.hg.mappings) != set(networks.hg.mappings):
+                raise ValueError("Known behaviors and logical networks must have the same mappings")
+
+            networks = networks.reindex(known.hg)
+
+        if len(self.setup.cues()) <= max_cues:
+            if known is not None:
+                networks = known.concat(networks)
+
+            behaviors = __hash_io__(networks, self.setup, n_jobs)
+        else:
+            n = len(networks)
+            cpu = n_jobs if n_jobs > -1 else mp.cpu_count()
+
+            if cpu > 1:
+                lpart = int(np.ceil(n / float(cpu))) if n > cpu else 1
+                parts = networks.split(np.arange(lpart, n, lpart))
+
+                # partial behaviors are merged pairwise in parallel rounds, keeping their order
+                with Parallel(n_jobs=n_jobs) as parallel:
+                    behaviors = parallel(delayed(__learn_io__)(part, self.setup, configure)
+                                         for part in parts)
+                    if known is not None:
+                        behaviors.insert(0, known)
+
+                    while len(behaviors) > 1:
+                        pairs = list(zip(behaviors[::2], behaviors[1::2]))
+                        merged = parallel(delayed(__merge_io__)(left, right, self.setup, configure)
+                                          for left, right in pairs)
+                        behaviors = merged + behaviors[2*len(pairs):]
+
+                behaviors = behaviors[0]
+            elif known is not None:
+                behaviors = __learn_io__(known.concat(networks), self.setup, configure, len(known))
+            else:
+                behaviors = __learn_io__(networks, self.setup, configure)
 
-        behaviors = __learn_io__(networks, self.setup, configure)
         self.stats['time_io'] = timeit.default_timer() - start
 
         self._logger.info("%s input-output logical behaviors found in %.4fs", len(behaviors), self.stats['time_io'])
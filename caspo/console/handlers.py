@@ -37,20 +37,47 @@ def learn_handler(args):
     dataset = core.Dataset(args.midas, args.time)
     zipped = graph.compress(dataset.setup)
 
-    learner = learn.Learner(zipped, dataset, args.length, args.discretization, args.factor)
+    learner = learn.Learner(zipped, dataset, args.length, args.discretization, args.factor,
+                            args.cache)
     logger.info("Number of hyperedges (possible logical mappings) derived from the compressed PKN: %d", len(learner.hypergraph.hyper))
 
+    if args.stream:
+        filename = os.path.join(args.out, 'networks.csv')
+        learner.networks = core.LogicalNetworkWriter(learner.hypergraph, filename, dataset=dataset,
+                                                     size=True)
+        logger.info("Logical networks will be written to %s while enumerating", filename)
+
+    elif args.memmap:
+        path = os.path.join(args.out, 'networks')
+        learner.networks = core.LogicalNetworkList.from_hypergraph(learner.hypergraph, packed=True,
+                                                                   path=path)
+        logger.info("Logical networks will be stored as memory-mapped files in %s", path)
+
     if args.optimum:
         learner.optimum = core.LogicalNetworkList.from_csv(args.optimum)[0]
 
     configure = ft.partial(configure_mt, args) if args.threads else None
-    learner.learn(args.fit, args.size, configure)
+    if args.sweep:
+        families = learner.sweep([(args.fit, args.size)] + args.sweep, configure)
+        for (fit, size), family in zip(args.sweep, families[1:]):
+            filename = os.path.join(args.out, 'networks-fit%s-size%s.csv' % (fit, size))
+            family.to_csv(filename, size=True, mse=True)
 
-    logger.info("Weighted MSE: %.4f", learner.networks.weighted_mse(dataset))
+        networks = families[0]
+    else:
+        learner.learn(args.fit, args.size, configure)
+
+        if args.stream:
+            networks = core.LogicalNetworkList.from_csv(learner.networks.filename, packed=True)
+        else:
+            networks = learner.networks
+
+    if len(networks):
+        logger.info("Weighted MSE: %.4f", networks.weighted_mse(dataset))
 
     rows = []
-    exclusive, inclusive = learner.networks.combinatorics()
-    for m, f in learner.networks.frequencies_iter():
+    exclusive, inclusive = networks.combinatorics()
+    for m, f in networks.frequencies_iter():
         row = dict(mapping="%s" % str(m), frequency=f, exclusive="", inclusive="")
         if m in exclusive:
             row["exclusive"] = ";".join(map(str, exclusive[m]))
@@ -66,8 +93,10 @@ def learn_handler(args):
 
     visualize.mappings_frequency(df, args.out)
 
-    df = learner.networks.to_dataframe(dataset=dataset, size=True)
-    df.to_csv(os.path.join(args.out, 'networks.csv'), index=False)
+    if not args.stream:
+        networks.to_csv(os.path.join(args.out, 'networks.csv'), size=True, mse=True)
+
+    df = pd.read_csv(os.path.join(args.out, 'networks.csv'), usecols=['mse', 'size'])
 
     visualize.networks_distribution(df, args.out)
 
@@ -83,9 +112,15 @@ def classify_handler(args):
 
     classifier = classify.Classifier(networks, setup)
 
-    logger.info("Classifying %s logical networks...", len(networks))
+    known = None
+    if args.behaviors:
+        known = core.LogicalNetworkList.from_csv(args.behaviors)
+        logger.info("Classifying %s logical networks against %s known behaviors...",
+                    len(networks), len(known))
+    else:
+        logger.info("Classifying %s logical networks...", len(networks))
 
-    behaviors = classifier.classify(configure=configure)
+    behaviors = classifier.classify(configure=configure, max_cues=args.max_cues, behaviors=known)
 
     setup = setup.filter(behaviors)
 
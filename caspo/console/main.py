@@ -35,6 +35,10 @@ caspo is free software: you are free to change and redistribute it.
 There is NO WARRANTY, to the extent permitted by law.\n
 """
 
+def tolerance(value):
+    fit, size = value.split(',')
+    return float(fit), int(size)
+
 def run():
     clingo_parser = argparse.ArgumentParser(add_help=False)
     clingo_parser.add_argument("--threads", dest="threads", type=int, metavar="T", help="run clingo with given number of threads")
@@ -56,12 +60,31 @@ def run():
     learn.add_argument("--factor", dest="factor", type=int, default=100, choices=[1, 10, 100, 1000], help="discretization over [0,D] (Default to 100)", metavar="D")
     learn.add_argument("--discretization", dest="discretization", default='round', choices=['round', 'floor', 'ceil'], help="discretization function: round, floor, ceil (Default to round)", metavar="T")
     learn.add_argument("--length", dest="length", type=int, default=0, help="max conjunctions length (sources per hyperedges) (Default to 0; unbounded)", metavar="L")
+    sweep = learn.add_mutually_exclusive_group()
+    sweep.add_argument("--stream", dest="stream", action='store_true',
+                       help="write logical networks to the output file while enumerating "
+                            "(Default to False)")
+    sweep.add_argument("--sweep", dest="sweep", type=tolerance, nargs='+', default=[],
+                       help="additional tolerances over fitness and size, e.g. 0.02,1, written to "
+                            "networks-fitF-sizeS.csv (enumerate only once)", metavar="F,S")
+    learn.add_argument("--cache", dest="cache", metavar="C",
+                       help="directory where expanded hypergraphs are cached across runs "
+                            "(Default to none)")
+    learn.add_argument("--memmap", dest="memmap", action='store_true',
+                       help="store logical networks in memory-mapped files under the output folder "
+                            "while enumerating, not allowed with --stream (Default to False)")
     learn.set_defaults(handler=learn_handler)
 
     classify = subparsers.add_parser("classify", parents=[clingo_parser])
     classify.add_argument("networks", help="logical networks in CSV format")
     classify.add_argument("setup", help="experimental setup in JSON format")
     classify.add_argument("--midas", dest="midas", nargs=2, metavar=("M", "T"), help="experimental dataset in MIDAS file and time-point to be used")
+    classify.add_argument("--behaviors", dest="behaviors", metavar="B",
+                          help="known input-output behaviors in CSV format to be updated with the "
+                               "given logical networks")
+    classify.add_argument("--max-cues", dest="max_cues", type=int, default=20, metavar="C",
+                          help="classify by simulation if the setup has at most C cues, otherwise "
+                               "use clingo (Default to 20)")
     classify.set_defaults(handler=classify_handler)
 
     predict = subparsers.add_parser("predict")
@@ -111,6 +134,10 @@ def run():
 
     args = parser.parse_args()
 
+    # networks streamed to the output file are not kept in memory-mapped files
+    if args.cmd == "learn" and args.stream and args.memmap:
+        learn.error("argument --memmap: not allowed with argument --stream")
+
     logger = logging.getLogger("caspo")
     logger.setLevel(logging.INFO)
 
@@ -103,7 +103,7 @@ class Controller(object):
         networks : :class:`caspo.core.logicalnetwork.LogicalNetworkList`
         scenarios : :class:`caspo.control.ScenarioList`
         strategies : :class:`caspo.core.clamping.ClampingList`
-        instance : str
+        instance : :class:`caspo.core.instance.Instance`
         encodings : dict
         stats : dict
     """
@@ -116,7 +116,7 @@ class Controller(object):
         for v in (n for n in networks.hg.nodes if n not in scenarios.exclude):
             fs.add(clingo.Function("candidate", [clingo.String(v)]))
 
-        self.instance = ". ".join(map(str, fs)) + ". #show intervention/2."
+        self.instance = core.Instance(fs, [('intervention', 2)])
 
         root = os.path.dirname(__file__)
         self.encodings = {
@@ -131,9 +131,9 @@ class Controller(object):
         self._strategies = None
         self._logger = logging.getLogger("caspo")
 
-    def __save__(self, model):
+    def __strategy__(self, model):
         tuples = (f.arguments for f in model.symbols(shown=True))
-        self._strategies.append(core.Clamping.from_tuples(((v.string, s.number) for v, s in tuples)))
+        return core.Clamping.from_tuples(((v.string, s.number) for v, s in tuples))
 
     def control(self, size=0, configure=None):
         """
@@ -161,8 +161,30 @@ class Controller(object):
         configure : callable
             Callable object responsible of setting clingo configuration
         """
-        self._strategies = []
+        self._strategies = list(self.iter_strategies(size, configure))
 
+        self._logger.info("%s optimal intervention strategies found in %.4fs", len(self._strategies), self.stats['time_enumeration'])
+
+        self.strategies = core.ClampingList(self._strategies)
+
+    def iter_strategies(self, size=0, configure=None):
+        """
+        Iterates over all inclusion-minimal intervention strategies up to the given size as they are
+        enumerated by the solver. The enumeration is stopped if the iteration is not continued.
+
+        Parameters
+        ----------
+        size : int
+            Maximum number of intervention per intervention strategy
+
+        configure : callable
+            Callable object responsible of setting clingo configuration
+
+        Yields
+        ------
+        caspo.core.clamping.Clamping
+            The next intervention strategy
+        """
         solver = clingo.Control(['-c maxsize=%s' % size])
 
         solver.configuration.solve.models = '0'
@@ -181,15 +203,13 @@ class Controller(object):
 
         solver.configuration.solve.enum_mode = 'domRec'
 
-        solver.add("base", [], self.instance)
+        self.instance.load(solver)
         solver.load(self.encodings['control'])
 
         solver.ground([("base", [])])
-        solver.solve(on_model=self.__save__)
+        with solver.solve(yield_=True) as handle:
+            for model in handle:
+                yield self.__strategy__(model)
 
         self.stats['time_optimum'] = solver.statistics['summary']['times']['solve']
         self.stats['time_enumeration'] = solver.statistics['summary']['times']['total']
-
-        self._logger.info("%s optimal intervention strategies found in %.4fs", len(self._strategies), self.stats['time_enumeration'])
-
-        self.strategies = core.ClampingList(self._strategies)
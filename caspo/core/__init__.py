@@ -22,5 +22,7 @@ from .clause import Clause
 from .graph import Graph
 from .hypergraph import HyperGraph
 from .literal import Literal
-from .logicalnetwork import LogicalNetworkList, LogicalNetwork
+from .logicalnetwork import LogicalNetworkList, LogicalNetwork, LogicalNetworkWriter, \
+    PredictionsAggregator
 from .dataset import Dataset
+from .instance import Instance
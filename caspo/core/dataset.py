@@ -41,12 +41,20 @@ class Dataset(pd.DataFrame):
 
         clampings : :class:`caspo.core.clamping.ClampingList`
 
+        conditions : :class:`caspo.core.clamping.ClampingList`
+
+        experiments : `numpy.ndarray`_
+
         readouts : `pandas.DataFrame`_
 
 
     .. _pandas.DataFrame: http://pandas.pydata.org/pandas-docs/stable/dsintro.html#dataframe
+    .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
     """
 
+    _metadata = ['setup', '_cues', '_signs', '_experiments', '_readouts', '_observed',
+                 '_conditions', '_clampings']
+
     def __init__(self, midas, time):
         df = pd.read_csv(midas)
 
@@ -68,25 +76,66 @@ class Dataset(pd.DataFrame):
 
         self.setup = Setup(stimuli, inhibitors, readouts)
 
+        # MIDAS columns are parsed only once: each cue is mapped to its clamping sign in every
+        # experiment (stimuli to 1 or -1 and inhibitors to -1 or 0 if not inhibited) and readouts to
+        # a matrix of values
+        cues = [c for c in self.columns if c.startswith('TR')]
+        values = self[cues].values == 1
+        signs = np.where(values, 1, -1)
+        for j, c in enumerate(cues):
+            if self.is_inhibitor(c):
+                signs[:, j] = np.where(values[:, j], -1, 0)
+
+        # replicated experiments (rows) with the same cues are grouped by experimental condition
+        conditions = {}
+        experiments = [conditions.setdefault(tuple(row), len(conditions)) for row in signs.tolist()]
+
+        self._cues = [c[3:-1] if self.is_inhibitor(c) else c[3:] for c in cues]
+        self._signs = np.array(list(conditions), dtype=int).reshape(len(conditions), len(cues))
+        self._experiments = np.array(experiments, dtype=int)
+        self._readouts = self[[c for c in self.columns if self.is_readout(c)]].values.astype(float)
+        self._observed = ~np.isnan(self._readouts)
+        self._conditions = None
+        self._clampings = None
+
     @property
-    def clampings(self):
-        clampings = []
-        for _, row in self.filter(regex='^TR').iterrows():
-            literals = []
-            for var, sign in row.items():
-                if self.is_stimulus(var):
-                    literals.append(Literal(var[3:], 1 if sign == 1 else -1))
-                else:
-                    if sign == 1:
-                        literals.append(Literal(var[3:-1], -1))
+    def conditions(self):
+        if self._conditions is None:
+            self._conditions = ClampingList(Clamping(Literal(self._cues[j], int(row[j]))
+                                                     for j in np.flatnonzero(row))
+                                            for row in self._signs)
 
-            clampings.append(Clamping(literals))
+        return self._conditions
 
-        return ClampingList(clampings)
+    @property
+    def experiments(self):
+        return self._experiments
+
+    @property
+    def clampings(self):
+        if self._clampings is None:
+            conditions = self.conditions
+            self._clampings = ClampingList(conditions[i] for i in self._experiments.tolist())
+
+        return self._clampings
 
     @property
     def readouts(self):
-        return self.filter(regex='^DV').rename(columns=lambda c: c[3:]).astype(float)
+        # a new frame is returned, thus callers modifying it never alter the parsed readouts
+        return pd.DataFrame(self._readouts.copy(), index=self.index, columns=self.setup.readouts)
+
+    @property
+    def observations(self):
+        """
+        Observed (non-missing) readouts values
+
+        Returns
+        -------
+        tuple
+            Experiment indexes, readout indexes and values of every observation as arrays
+        """
+        rows, cols = np.nonzero(self._observed)
+        return rows, cols, self._readouts[rows, cols]
 
     @staticmethod
     def is_stimulus(name):
@@ -143,7 +192,7 @@ class Dataset(pd.DataFrame):
         Parameters
         ----------
         discrete : callable
-            A discretization function
+            A discretization function mapping a `numpy.ndarray`_ of values to integers
 
         Returns
         -------
@@ -151,15 +200,20 @@ class Dataset(pd.DataFrame):
             Representation of the dataset as a set of `clingo.Function`_ instances
 
 
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
         .. _clingo.Function: https://potassco.github.io/clingo/python-api/current/clingo.html#-Function
         """
-        fs = self.clampings.to_funset("exp")
+        fs = self.conditions.to_funset("exp")
         fs = fs.union(self.setup.to_funset())
 
-        for i, row in self.readouts.iterrows():
-            for var, val in row.items():
-                if not np.isnan(val):
-                    fs.add(clingo.Function('obs', [clingo.Number(i),
-                        clingo.String(var), clingo.Number(discrete(val))]))
+        # replicated observations (same condition, readout and discretized value) are given once
+        # with their number
+        rows, cols, values = self.observations
+        values = np.asarray(discrete(values), dtype=int)
+        keys = np.column_stack([self._experiments[rows], cols, values])
+        keys, counts = np.unique(keys.reshape(-1, 3), axis=0, return_counts=True)
+        for (i, j, val), n in zip(keys.tolist(), counts.tolist()):
+            fs.add(clingo.Function('obs', [clingo.Number(i), clingo.String(self.setup.readouts[j]),
+                                           clingo.Number(val), clingo.Number(n)]))
 
         return fs
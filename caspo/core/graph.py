@@ -126,55 +126,86 @@ class Graph(nx.MultiDiGraph):
             Compressed graph
         """
         designated = set(setup.nodes)
-        zipped = self.copy()
-
-        marked = [(n, d) for n, d in self.nodes(data=True) if n not in designated and not d.get('compressed', False)]
-        while marked:
-            for node, _ in sorted(marked):
-                backward = zipped.predecessors(node)
-                forward = zipped.successors(node)
-
-                if not backward or (len(backward) == 1 and not backward[0] in forward):
-                    self.__merge_source_targets(node, zipped)
-
-                elif not forward or (len(forward) == 1 and not forward[0] in backward):
-                    self.__merge_target_sources(node, zipped)
-
-                else:
-                    designated.add(node)
-
-            marked = [(n, d) for n, d in self.nodes(data=True) if n not in designated and not d.get('compressed', False)]
-
-        not_compressed = [(n, d) for n, d in zipped.nodes(data=True) if not d.get('compressed', False)]
-        return zipped.subgraph([n for n, _ in not_compressed])
-
-    def __merge_source_targets(self, node, zipped):
-        predecessor = zipped.predecessors(node)
+        compressed = set(n for n, d in self.nodes(data=True) if d.get('compressed', False))
+
+        # adjacency among non-compressed nodes with the signs of parallel edges, in the same order
+        # as in a copy of the graph. It is updated as nodes are merged so that neighbours are never
+        # filtered again.
+        preds = dict((n, {}) for n in self.nodes)
+        succs = dict((n, {}) for n in self.nodes)
+        for source, target, sign in self.edges(data='sign'):
+            if source not in compressed and target not in compressed:
+                succs[source].setdefault(target, []).append(sign)
+                preds[target].setdefault(source, []).append(sign)
+
+        added = []
+
+        # merging a node never changes the decision taken for previous nodes, hence nodes are
+        # visited once by name
+        for node in sorted(n for n in self.nodes if n not in designated and n not in compressed):
+            backward = list(preds[node])
+            forward = list(succs[node])
+
+            if not backward or (len(backward) == 1 and not backward[0] in succs[node]):
+                edges = self.__merge_source_targets(node, preds, succs)
+
+            elif not forward or (len(forward) == 1 and not forward[0] in preds[node]):
+                edges = self.__merge_target_sources(node, preds, succs)
+
+            else:
+                designated.add(node)
+                continue
+
+            self.nodes[node]['compressed'] = True
+            compressed.add(node)
+
+            for source in preds.pop(node):
+                del succs[source][node]
+            for target in succs.pop(node):
+                del preds[target][node]
+
+            for source, target, sign in edges:
+                succs[source].setdefault(target, []).append(sign)
+                preds[target].setdefault(source, []).append(sign)
+                added.append((source, target, sign))
+
+        # edges of compressed nodes are hidden by the subgraph, thus only the remaining edges of the
+        # graph followed by the new edges (in the order they were found) are copied
+        zipped = self.__class__()
+        zipped.graph.update(self.graph)
+        zipped.add_nodes_from(self.nodes(data=True))
+        zipped.add_edges_from((u, v, k, d) for u, v, k, d in self.edges(keys=True, data=True)
+                              if u not in compressed and v not in compressed)
+        zipped.add_edges_from((u, v, {'sign': sign}) for u, v, sign in added
+                              if u not in compressed and v not in compressed)
+
+        return zipped.subgraph([n for n in self.nodes if n not in compressed])
+
+    @staticmethod
+    def __merge_source_targets(node, preds, succs):
         edges = []
-        for target in zipped.successors(node):
-            if predecessor:
-                for source_edge in zipped[predecessor[0]][node].values():
-                    for target_edge in zipped[node][target].values():
-                        sign = {'sign': source_edge['sign']*target_edge['sign']}
-                        if not zipped.has_edge(predecessor[0], target) or sign not in list(zipped[predecessor[0]][target].values()):
-                            edges.append((predecessor[0], target, sign))
-
-        self.nodes[node]['compressed'] = zipped.nodes[node]['compressed'] = True
-        zipped.add_edges_from(edges)
-
-    def __merge_target_sources(self, node, zipped):
-        successor = zipped.successors(node)
+        for predecessor in preds[node]:
+            for target in succs[node]:
+                signs = succs[predecessor].get(target, [])
+                for source_sign in preds[node][predecessor]:
+                    for target_sign in succs[node][target]:
+                        if source_sign*target_sign not in signs:
+                            edges.append((predecessor, target, source_sign*target_sign))
+
+        return edges
+
+    @staticmethod
+    def __merge_target_sources(node, preds, succs):
         edges = []
-        for source in zipped.predecessors(node):
-            if successor:
-                for target_edge in zipped[source][node].values():
-                    for source_edge in zipped[node][successor[0]].values():
-                        sign = {'sign': target_edge['sign']*source_edge['sign']}
-                        if not zipped.has_edge(source, successor[0]) or sign not in list(zipped[source][successor[0]].values()):
-                            edges.append((source, successor[0], {'sign': target_edge['sign']*source_edge['sign']}))
-
-        self.nodes[node]['compressed'] = zipped.nodes[node]['compressed'] = True
-        zipped.add_edges_from(edges)
+        for successor in succs[node]:
+            for source in preds[node]:
+                signs = succs[source].get(successor, [])
+                for target_sign in preds[node][source]:
+                    for source_sign in succs[node][successor]:
+                        if target_sign*source_sign not in signs:
+                            edges.append((source, successor, target_sign*source_sign))
+
+        return edges
 
     def __plot__(self):
         """
@@ -16,6 +16,9 @@
 # along with caspo.  If not, see <http://www.gnu.org/licenses/>.import random
 # -*- coding: utf-8 -*-
 
+import os
+import json
+import hashlib
 from collections import defaultdict
 
 import itertools as it
@@ -68,18 +71,26 @@ class HyperGraph(object):
         self.hyper = hyper
         self.edges = edges
 
+        literals = defaultdict(list)
+        for i, source, sign in zip(self.edges['hyper_idx'], self.edges['name'], self.edges['sign']):
+            literals[i].append(Literal(source, sign))
+
         self.clauses = {}
         self.clauses_idx = {}
-        for i, h in self.edges.groupby('hyper_idx'):
-            literals = [Literal(source, sign) for _, source, sign in h.itertuples(index=False)]
-            clause = Clause(literals)
+        for i in sorted(literals):
+            clause = Clause(literals[i])
 
             self.clauses[i] = clause
             self.clauses_idx[clause] = i
 
+        # hyperedges indexed by target node
+        targets = defaultdict(list)
+        for hyper_idx, node_idx in self.hyper.items():
+            targets[node_idx].append(hyper_idx)
+
         mappings = []
         for node_idx, variable in self.nodes.items():
-            for hyper_idx, _ in self.hyper[self.hyper == node_idx].items():
+            for hyper_idx in targets[node_idx]:
                 mappings.append(Mapping(self.clauses[hyper_idx], variable))
 
         self._mappings = None
@@ -110,7 +121,7 @@ class HyperGraph(object):
         return self.nodes.iloc[index]
 
     @classmethod
-    def from_graph(cls, graph, length=0):
+    def from_graph(cls, graph, length=0, cache=None):
         """
         Creates a hypergraph (expanded graph) from a :class:`caspo.core.graph.Graph` object instance
 
@@ -122,11 +133,33 @@ class HyperGraph(object):
         length : int
             Maximum length for hyperedges source sets. If 0, use maximum possible in each case.
 
+        cache : Optional[str]
+            Absolute path to a directory where expanded hypergraphs are cached. If given, the
+            hypergraph is read from the cache if the same graph (same nodes and edges, in any order)
+            was already expanded with the same length. Otherwise, it is expanded and cached.
+
         Returns
         -------
         caspo.core.hypergraph.HyperGraph
             Created object instance
         """
+        if cache is not None:
+            filename = os.path.join(cache, cls.__key(graph, length) + '.json')
+            if os.path.exists(filename):
+                return cls.from_json(filename)
+
+            hypergraph = cls.from_graph(graph, length)
+
+            # runs may share the cache, thus the hypergraph is written to a temporary file first and
+            # renamed, such that a concurrent run never reads a partial file
+            os.makedirs(cache, exist_ok=True)
+
+            tmp = '%s.%s.tmp' % (filename, os.getpid())
+            hypergraph.to_json(tmp)
+            os.replace(tmp, filename)
+
+            return hypergraph
+
         nodes = []
         hyper = []
         edges = defaultdict(list)
@@ -135,24 +168,20 @@ class HyperGraph(object):
         for i, node in enumerate(graph.nodes()):
             nodes.append(node)
 
-            preds = graph.in_edges(node, data=True)
-            l = len(preds)
+            preds = list(graph.in_edges(node, data=True))
+            l = len(set(source for source, _, _ in preds))
             if length > 0:
                 l = min(length, l)
 
-            for literals in it.chain.from_iterable(it.combinations(preds, r+1) for r in range(l)):
-                valid = defaultdict(int)
-                for source, _, _ in literals:
-                    valid[source] += 1
-
-                if all(c == 1 for c in valid.values()):
-                    hyper.append(i)
-                    for source, _, data in literals:
-                        edges['hyper_idx'].append(j)
-                        edges['name'].append(source)
-                        edges['sign'].append(data['sign'])
+            combinations = (cls.__combinations(preds, r+1) for r in range(l))
+            for literals in it.chain.from_iterable(combinations):
+                hyper.append(i)
+                for source, _, data in literals:
+                    edges['hyper_idx'].append(j)
+                    edges['name'].append(source)
+                    edges['sign'].append(data['sign'])
 
-                    j += 1
+                j += 1
 
         nodes = pd.Series(nodes, name='name')
         hyper = pd.Series(hyper, name='node_idx')
@@ -160,10 +189,196 @@ class HyperGraph(object):
 
         return cls(nodes, hyper, edges)
 
-    def to_funset(self):
+    @staticmethod
+    def __combinations(preds, r):
+        """
+        Iterates over all combinations of `r` in-edges having pairwise different sources, in the
+        same order as `itertools.combinations`, without generating those using a source twice
+        """
+        chosen, sources = [], set()
+
+        def extend(start):
+            if len(chosen) == r:
+                yield tuple(chosen)
+                return
+
+            for k in range(start, len(preds) - (r - len(chosen)) + 1):
+                source = preds[k][0]
+                if source not in sources:
+                    chosen.append(preds[k])
+                    sources.add(source)
+
+                    for combination in extend(k + 1):
+                        yield combination
+
+                    chosen.pop()
+                    sources.remove(source)
+
+        return extend(0)
+
+    @classmethod
+    def from_mappings(cls, mappings):
+        """
+        Creates a hypergraph having exactly one hyperedge for each given mapping. Unlike
+        :func:`from_graph`, no combinations are expanded and the mappings of the hypergraph are the
+        given ones, in the same order.
+
+        Parameters
+        ----------
+        mappings : iterable
+            Iterable over :class:`caspo.core.mapping.Mapping` object instances
+
+        Returns
+        -------
+        caspo.core.hypergraph.HyperGraph
+            Created object instance
+        """
+        mappings = list(mappings)
+
+        nodes = []
+        index = {}
+        hyper = []
+        edges = defaultdict(list)
+
+        for j, mapping in enumerate(mappings):
+            for variable in it.chain([mapping.target], (source for source, _ in mapping.clause)):
+                if variable not in index:
+                    index[variable] = len(nodes)
+                    nodes.append(variable)
+
+            hyper.append(index[mapping.target])
+            for source, sign in mapping.clause:
+                edges['hyper_idx'].append(j)
+                edges['name'].append(source)
+                edges['sign'].append(sign)
+
+        nodes = pd.Series(nodes, name='name')
+        hyper = pd.Series(hyper, name='node_idx', dtype=int)
+        edges = pd.DataFrame(edges, columns=['hyper_idx', 'name', 'sign'])
+
+        hypergraph = cls(nodes, hyper, edges)
+        hypergraph.mappings = mappings
+
+        return hypergraph
+
+    @staticmethod
+    def __key(graph, length):
+        """
+        Returns a digest of the graph nodes and edges and the maximum length. Nodes and edges are
+        sorted so that the digest does not depend on their order, which may vary between runs.
+        """
+        tuples = [(node, sorted((source, int(data['sign']))
+                                for source, _, data in graph.in_edges(node, data=True)))
+                  for node in sorted(graph.nodes())]
+        return hashlib.sha1(json.dumps([length, tuples]).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_json(cls, filename):
+        """
+        Creates a hypergraph from a JSON file, e.g., as written by :func:`to_json`
+
+        Parameters
+        ----------
+        filename : str
+            Absolute path to JSON file
+
+        Returns
+        -------
+        caspo.core.hypergraph.HyperGraph
+            Created object instance
+        """
+        with open(filename, encoding='utf-8') as fp:
+            raw = json.load(fp)
+
+        nodes = pd.Series(raw['nodes'], name='name')
+        hyper = pd.Series(raw['hyper'], name='node_idx', dtype=int)
+        edges = pd.DataFrame(raw['edges'], columns=['hyper_idx', 'name', 'sign'])
+
+        return cls(nodes, hyper, edges)
+
+    def to_json(self, filename):
+        """
+        Writes the hypergraph to a JSON file
+
+        Parameters
+        ----------
+        filename : str
+            Absolute path where to write the JSON file
+        """
+        edges = dict((c, self.edges[c].tolist()) for c in ['hyper_idx', 'name', 'sign'])
+        with open(filename, 'w', encoding='utf-8') as fp:
+            json.dump(dict(nodes=self.nodes.tolist(), hyper=self.hyper.tolist(), edges=edges), fp)
+
+    def relevant(self, setup):
+        """
+        Returns the hyperedges that may be used by a logical network with respect to the given
+        experimental setup. In a logical network, every source of a hyperedge must be a stimulus or
+        be reachable from a stimulus and every target must be a readout or reach a readout. Since a
+        hyperedge can only be used if these conditions hold in the whole hypergraph, other
+        hyperedges are discarded and reachability is recomputed until fixpoint.
+
+        Parameters
+        ----------
+        setup : :class:`caspo.core.setup.Setup`
+            Experimental setup
+
+        Returns
+        -------
+        set
+            The set of hyperedges ids (index in attribute :attr:`hyper`) which may be used
+        """
+        stimuli, readouts = set(setup.stimuli), set(setup.readouts)
+
+        targets = dict((j, self.variable(i)) for j, i in self.hyper.items())
+        sources = dict((j, set(l.variable for l in clause)) for j, clause in self.clauses.items())
+
+        # hyperedges indexed by source and target nodes
+        outgoing, incoming = defaultdict(list), defaultdict(list)
+        for j, target in targets.items():
+            incoming[target].append(j)
+            for source in sources[j]:
+                outgoing[source].append(j)
+
+        hyper = set(targets)
+        while True:
+            forward = self.__reachable(stimuli, outgoing, lambda j: [targets[j]], hyper)
+            backward = self.__reachable(readouts, incoming, lambda j: sources[j], hyper)
+
+            discarded = set(j for j in hyper
+                            if targets[j] not in backward or not sources[j].issubset(forward))
+            if not discarded:
+                return hyper
+
+            hyper.difference_update(discarded)
+
+    @staticmethod
+    def __reachable(start, index, neighbours, hyper):
+        """
+        Returns the nodes reachable from the given ones through the given hyperedges
+        """
+        reached = set(start)
+        pending = list(reached)
+        while pending:
+            node = pending.pop()
+            for j in index[node]:
+                if j in hyper:
+                    for n in neighbours(j):
+                        if n not in reached:
+                            reached.add(n)
+                            pending.append(n)
+
+        return reached
+
+    def to_funset(self, hyper=None):
         """
         Converts the hypergraph to a set of `clingo.Function`_ instances
 
+        Parameters
+        ----------
+        hyper : Optional[set]
+            If given, only these hyperedges ids (and the nodes they use) are included, e.g., as
+            returned by :func:`relevant`
+
         Returns
         -------
         set
@@ -172,16 +387,26 @@ class HyperGraph(object):
 
         .. _clingo.Function: https://potassco.github.io/clingo/python-api/current/clingo.html#-Function
         """
+        if hyper is None:
+            hyper = set(self.hyper.index)
+            nodes = set(self.nodes)
+        else:
+            nodes = set(self.variable(self.hyper[j]) for j in hyper)
+            nodes.update(l.variable for j in hyper for l in self.clauses[j])
+
         fs = set()
         for i, n in self.nodes.items():
-            fs.add(clingo.Function('node', [clingo.String(n), clingo.Number(i)]))
+            if n in nodes:
+                fs.add(clingo.Function('node', [clingo.String(n), clingo.Number(i)]))
 
         for j, i in self.hyper.items():
-            fs.add(clingo.Function('hyper', [clingo.Number(i), clingo.Number(j),
-                clingo.Number(len(self.edges[self.edges.hyper_idx == j]))]))
+            if j in hyper:
+                fs.add(clingo.Function('hyper', [clingo.Number(i), clingo.Number(j),
+                    clingo.Number(len(self.clauses[j]))]))
 
         for j, v, s in self.edges.itertuples(index=False):
-            fs.add(clingo.Function('edge', [clingo.Number(j), clingo.String(v),
-                clingo.Number(s)]))
+            if j in hyper:
+                fs.add(clingo.Function('edge', [clingo.Number(j), clingo.String(v),
+                    clingo.Number(s)]))
 
         return fs
@@ -0,0 +1,77 @@
+# Copyright (c) 2014-2016, Santiago Videla
+#
+# This file is part of caspo.
+#
+# caspo is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# caspo is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with caspo.  If not, see <http://www.gnu.org/licenses/>.import random
+# -*- coding: utf-8 -*-
+
+class Instance(object):
+    """
+    Logic program instance made of facts given as `clingo.Function`_ instances. Facts are added to a
+    solver directly through the clingo backend instead of being converted to text and parsed again
+    by the solver.
+
+    Parameters
+    ----------
+    facts : iterable
+        Iterable over `clingo.Function`_ instances
+
+    show : list[(str,int)]
+        Signatures (name, arity) of predicates to be shown
+
+    Attributes
+    ----------
+    facts : set
+    show : list[(str,int)]
+
+
+    .. _clingo.Function: https://potassco.github.io/clingo/python-api/current/clingo.html#-Function
+    """
+
+    def __init__(self, facts=None, show=None):
+        self.facts = set(facts or [])
+        self.show = list(show or [])
+
+    def load(self, solver):
+        """
+        Adds the instance to a given solver. Facts are added to the ground program through the
+        backend, thus they are available to ground any program part afterwards. Show directives are
+        added to the `base` program part.
+
+        Parameters
+        ----------
+        solver : `clingo.Control`_
+            The solver where to add the instance
+
+
+        .. _clingo.Control: https://potassco.github.io/clingo/python-api/current/clingo.html#-Control
+        """
+        with solver.backend() as backend:
+            for fact in self.facts:
+                backend.add_rule([backend.add_atom(fact)])
+
+        if self.show:
+            solver.add("base", [], " ".join("#show %s/%s." % signature for signature in self.show))
+
+    def __str__(self):
+        """
+        Returns the text representation of the instance
+
+        Returns
+        -------
+        str
+            Facts and show directives as a logic program
+        """
+        show = ["#show %s/%s." % signature for signature in self.show]
+        return " ".join(["%s." % fact for fact in self.facts] + show)
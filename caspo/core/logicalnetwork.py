@@ -18,12 +18,15 @@
 
 from collections import defaultdict
 
+import os
+import json
+import hashlib
 import itertools as it
 import networkx as nx
 import pandas as pd
 import numpy as np
 
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 
 from sklearn.metrics import mean_squared_error
 
@@ -35,11 +38,137 @@ from .graph import Graph
 from .hypergraph import HyperGraph
 
 
-def __parallel_predictions__(network, clampings, readouts, stimuli=None, inhibitors=None):
-    return network.predictions(clampings, readouts, stimuli, inhibitors).values
+# Maximum number of cells (literals x networks x clampings) in the arrays of each simulation chunk
+CHUNK_SIZE = 2**22
 
-def __parallel_mse__(network, clampings, readouts, observations, pos):
-    return mean_squared_error(observations, (network.predictions(clampings, readouts).values)[pos])
+def __mask__(mask, dtype):
+    return np.where(mask, ~dtype(0), dtype(0))
+
+def __pack__(arr):
+    """
+    Packs the last axis of a binary array into 64-bit words
+    """
+    words = -(-arr.shape[-1] // 64)
+    padded = np.zeros(arr.shape[:-1] + (words * 64,), dtype=bool)
+    padded[..., :arr.shape[-1]] = arr
+    return np.packbits(padded, axis=-1, bitorder='little').view(np.uint64)
+
+def __unpack__(arr, n):
+    """
+    Unpacks the second axis of a 3-D array of 64-bit words, as packed by :func:`__pack__`, into
+    `n` binary values
+    """
+    words = np.ascontiguousarray(arr.transpose(0, 2, 1)).view(np.uint8)
+    bits = np.unpackbits(words, axis=-1, bitorder='little')
+    return bits[:, :, :n].transpose(0, 2, 1).astype(np.int8)
+
+def __program__(mappings):
+    """
+    Compiles a list of mappings into integer arrays for the family-wide simulation. Clauses (resp.
+    disjunctions) of different lengths are padded by repeating their first literal (resp. mapping)
+    which leaves conjunctions (resp. disjunctions) unchanged.
+    """
+    variables, index = [], {}
+    for clause, target in mappings:
+        for var in it.chain((source for source, _ in clause), [target]):
+            if var not in index:
+                index[var] = len(variables)
+                variables.append(var)
+
+    width = max([len(clause) for clause, _ in mappings] or [0])
+    literals = np.zeros((len(mappings), width), dtype=int)
+    negated = np.zeros((len(mappings), width), dtype=bool)
+    incidence = np.zeros((len(mappings), len(variables)), dtype=bool)
+    groups = defaultdict(list)
+    for i, (clause, target) in enumerate(mappings):
+        clause = sorted(clause)
+        for k in range(width):
+            source, sign = clause[k] if k < len(clause) else clause[0]
+            literals[i, k] = index[source]
+            negated[i, k] = sign == -1
+
+        incidence[i, literals[i]] = True
+        incidence[i, index[target]] = True
+        groups[index[target]].append(i)
+
+    heads = np.array(sorted(groups), dtype=int)
+    depth = max([len(g) for g in groups.values()] or [0])
+    disjunctions = np.array([[groups[h][k] if k < len(groups[h]) else groups[h][0]
+                              for k in range(depth)] for h in heads], dtype=int)
+
+    return dict(variables=variables, index=index, literals=literals, negated=negated,
+                heads=heads, disjunctions=disjunctions, incidence=incidence)
+
+def __fixpoint__(program, matrix, clamped, values):
+    """
+    Computes the fixpoint of several networks for several clampings at once.
+    Clampings are bit-sliced as packed by :func:`__pack__`, that is, each bit of a 64-bit word
+    corresponds to one clamping.
+
+    Parameters
+    ----------
+    program : dict
+        Compiled mappings as returned by :func:`__program__`
+
+    matrix : `numpy.ndarray`_
+        2-D binary array (networks x mappings)
+
+    clamped : `numpy.ndarray`_
+        2-D uint64 array (variables x words) telling whether each variable is clamped
+
+    values : `numpy.ndarray`_
+        2-D uint64 array (variables x words) with the value of each clamped variable
+
+    Returns
+    -------
+    `numpy.ndarray`_
+        3-D uint64 array (variables x networks x words) with the fixpoint value of each variable
+    """
+    fixed = (values & clamped)[:, np.newaxis, :]
+    state = np.repeat(fixed, len(matrix), axis=1)
+    if not len(program['heads']):
+        return state
+
+    literals, disjunctions = program['literals'], program['disjunctions']
+    negated = __mask__(program['negated'], np.uint64)[:, :, np.newaxis, np.newaxis]
+    active = __mask__(matrix.T != 0, np.uint64)[:, :, np.newaxis]
+    free = (~clamped)[program['heads'], np.newaxis, :]
+
+    while True:
+        clauses = state[literals[:, 0]] ^ negated[:, 0]
+        for k in range(1, literals.shape[1]):
+            clauses &= state[literals[:, k]] ^ negated[:, k]
+
+        clauses &= active
+        heads = clauses[disjunctions[:, 0]]
+        for k in range(1, disjunctions.shape[1]):
+            heads |= clauses[disjunctions[:, k]]
+
+        updated = np.repeat(fixed, len(matrix), axis=1)
+        updated[program['heads']] |= heads & free
+        if np.array_equal(updated, state):
+            return state
+
+        state = updated
+
+def __readouts__(program, matrix, state, readouts):
+    """
+    Extracts readouts values from the fixpoints computed by :func:`__fixpoint__`. As in
+    :func:`LogicalNetwork.predictions`, readouts not present in a network are inactive.
+
+    Returns
+    -------
+    `numpy.ndarray`_
+        3-D uint64 array (networks x words x readouts)
+    """
+    predictions = np.zeros((len(matrix), state.shape[2], len(readouts)), dtype=np.uint64)
+    present = np.dot(matrix != 0, program['incidence']).T
+    for j, readout in enumerate(readouts):
+        i = program['index'].get(readout)
+        if i is not None:
+            predictions[:, :, j] = state[i] & __mask__(present[i], np.uint64)[:, np.newaxis]
+
+    return predictions
 
 class LogicalNetworkList(object):
     """
@@ -58,71 +187,342 @@ class LogicalNetworkList(object):
         For each network in the list, it gives the number of networks having the same behavior.
         If None, an array of ones is initialised with the same length as the number of networks in the list.
 
+    packed : boolean
+        If True, networks are stored bit-packed using one bit per mapping (8 mappings per byte)
+
+    scores : Optional[`numpy.ndarray`_]
+        2-D array with the residual sum of squares (first column) and the mean squared error (second
+        column) of each network with respect to the dataset used to learn it. If None, an array of
+        NaN (unknown) is initialised.
+
+    Attributes
+    ----------
+    hg : :class:`caspo.core.hypergraph.HyperGraph`
+    packed : boolean
+    path : str
+        Directory where networks are stored as memory-mapped files or None if networks are stored in
+        memory. See :func:`from_hypergraph` and :func:`from_memmap`
+
 
     .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
     """
 
-    def __init__(self, hg, matrix=None, networks=None):
+    def __init__(self, hg, matrix=None, networks=None, packed=False, scores=None):
         self.hg = hg
+        self.__packed = packed
+        self.__path = None
 
         if matrix is None:
-            self.__matrix = np.array([])
-        else:
-            self.__matrix = matrix
+            matrix = np.zeros((0, len(hg.mappings)), dtype=np.int8)
+
+        if not isinstance(networks, np.ndarray):
+            if networks:
+                networks = np.array(networks, dtype=int)
+            else:
+                networks = np.ones(len(matrix), dtype=int)
+
+        if scores is None:
+            scores = np.full((len(matrix), 2), np.nan)
+
+        self.__length = len(matrix)
+        self.__rows = np.packbits(matrix, axis=1, bitorder='little') if packed else matrix
+        self.__weights = networks
+        self.__scores = scores
+
+    @classmethod
+    def __from_rows(cls, hg, rows, networks, packed, scores=None):
+        """
+        Creates a list of logical networks from rows already in the storage format
+        """
+        nlist = cls(hg, packed=packed)
+        nlist.__length = len(rows)
+        nlist.__rows = rows
+        nlist.__weights = networks
+        nlist.__scores = np.full((len(rows), 2), np.nan) if scores is None else scores
+        return nlist
+
+    @property
+    def packed(self):
+        """
+        boolean: whether networks are stored bit-packed
+        """
+        return self.__packed
+
+    @property
+    def path(self):
+        """
+        str: directory of the memory-mapped storage or None
+        """
+        return self.__path
+
+    @property
+    def rss(self):
+        """
+        `numpy.ndarray`_: residual sum of squares (discretized) of each network, NaN if unknown
+        """
+        return self.__scores[:self.__length, 0]
+
+    @property
+    def mse(self):
+        """
+        `numpy.ndarray`_: mean squared error of each network, NaN if unknown
+        """
+        return self.__scores[:self.__length, 1]
+
+    @property
+    def sizes(self):
+        """
+        `numpy.ndarray`_: size of each network as the sum of its clauses' length, computed by
+        chunks of networks
+        """
+        lengths = np.array([len(m.clause) for m in self.hg.mappings], dtype=int)
+        step = max(1, CHUNK_SIZE // max(1, len(lengths)))
+        sizes = [self.__block(i, i + step).dot(lengths) for i in range(0, self.__length, step)]
+        return np.concatenate(sizes) if sizes else np.zeros(0, dtype=int)
+
+    @staticmethod
+    def __files(path):
+        """
+        Returns the paths to the sidecar, matrix, weights and scores files of a memory-mapped list
+        """
+        files = ['mappings.json', 'matrix.bin', 'networks.bin', 'scores.bin']
+        return tuple(os.path.join(path, f) for f in files)
+
+    def __width(self):
+        """
+        Returns the number of columns of the storage buffer
+        """
+        return -(-len(self.hg.mappings) // 8) if self.__packed else len(self.hg.mappings)
+
+    def __mmap(self, capacity):
+        """
+        Resizes the files of the memory-mapped storage to the given capacity and maps them again
+        """
+        _, matrix, networks, scores = self.__files(self.__path)
+        unknown = not os.path.exists(scores)
+        sizes = [(matrix, capacity * self.__width()), (networks, capacity * 8),
+                 (scores, capacity * 16)]
+        for filename, nbytes in sizes:
+            with open(filename, 'r+b' if os.path.exists(filename) else 'w+b') as fd:
+                fd.truncate(nbytes)
+
+        rows = np.memmap(matrix, dtype=np.uint8 if self.__packed else np.int8, mode='r+',
+                         shape=(capacity, self.__width()))
+        weights = np.memmap(networks, dtype=np.int64, mode='r+', shape=(capacity,))
+        scores = np.memmap(scores, dtype=np.float64, mode='r+', shape=(capacity, 2))
+        if unknown:
+            scores[:] = np.nan
+
+        return rows, weights, scores
+
+    def flush(self):
+        """
+        Writes any pending change of a memory-mapped storage to disk, including the sidecar file
+        describing the mappings and the number of networks. It has no effect on in-memory lists.
+        """
+        if self.__path is None:
+            return
+
+        self.__rows.flush()
+        self.__weights.flush()
+        self.__scores.flush()
 
-        if isinstance(networks, np.ndarray):
-            self.__networks = networks
+        sidecar = self.__files(self.__path)[0]
+        with open(sidecar, 'w') as fd:
+            json.dump({'mappings': [str(m) for m in self.hg.mappings], 'packed': self.__packed,
+                       'length': self.__length}, fd)
+
+    @property
+    def __matrix(self):
+        """
+        `numpy.ndarray`_: 2-D binary array representation of all logical networks. If networks are
+        stored bit-packed, the whole matrix is unpacked, otherwise it is a view over the storage
+        """
+        return self.__block(0, self.__length)
+
+    def __block(self, start, stop):
+        """
+        Returns the 2-D binary array representation of logical networks from `start` to `stop`
+        """
+        rows = self.__rows[start:min(stop, self.__length)]
+        if self.__packed:
+            rows = np.unpackbits(rows, axis=1, count=len(self.hg.mappings), bitorder='little')
+            return rows.view(np.int8)
         else:
-            self.__networks = np.array(networks, dtype=int) if networks else np.ones(len(self.__matrix), dtype=int)
+            return rows
+
+    def __counts(self):
+        """
+        Returns the number of logical networks in the list having each mapping. On bit-packed
+        storage, bits are counted for each position within bytes over chunks of rows without
+        unpacking the matrix.
+        """
+        rows = self.__rows[:self.__length]
+        counts = np.zeros(rows.shape[1] * 8 if self.__packed else rows.shape[1], dtype=int)
+        step = max(1, CHUNK_SIZE // max(1, rows.shape[1]))
+        for i in range(0, len(rows), step):
+            chunk = rows[i:i+step]
+            if self.__packed:
+                for b in range(8):
+                    counts[b::8] += ((chunk >> b) & 1).sum(axis=0, dtype=int)
+            else:
+                counts += chunk.sum(axis=0, dtype=int)
+
+        return counts[:len(self.hg.mappings)]
+
+    @property
+    def __networks(self):
+        """
+        `numpy.ndarray`_: number of networks having the same behavior for each network in the list
+        (a view over the storage buffer)
+        """
+        return self.__weights[:self.__length]
+
+    def __reserve(self, n):
+        """
+        Ensures the storage buffers have room for `n` more networks. When the capacity is exceeded,
+        buffers are reallocated doubling their capacity so that appending networks one by one takes
+        amortized constant time.
+
+        Parameters
+        ----------
+        n : int
+            Number of networks to be added
+        """
+        capacity = len(self.__rows)
+        if self.__length + n > capacity:
+            capacity = max(self.__length + n, 2 * capacity, 16)
+
+            if self.__path is not None:
+                self.flush()
+                self.__rows, self.__weights, self.__scores = self.__mmap(capacity)
+                self.flush()
+                return
+
+            if self.__packed:
+                rows = np.zeros((capacity, self.__width()), dtype=np.uint8)
+            else:
+                dtype = self.__rows.dtype if self.__length else np.int8
+                rows = np.zeros((capacity, self.__width()), dtype=dtype)
+
+            rows[:self.__length] = self.__rows[:self.__length]
+
+            weights = np.zeros(capacity, dtype=int)
+            weights[:self.__length] = self.__networks
+
+            scores = np.full((capacity, 2), np.nan)
+            scores[:self.__length] = self.__scores[:self.__length]
+
+            self.__rows, self.__weights, self.__scores = rows, weights, scores
 
 
     @classmethod
-    def from_csv(cls, filename):
+    def from_csv(cls, filename, packed=False):
         """
         Creates a list of logical networks from a CSV file.
         Columns that cannot be parsed as a :class:`caspo.core.mapping.Mapping` are ignored
         except for a column named `networks` which (if present) is interpreted as the number
-        of logical networks having the same input-output behavior.
+        of logical networks having the same input-output behavior, and columns named `rss` and `mse`
+        which (if present) are interpreted as the scores of each logical network.
 
         Parameters
         ----------
         filename : str
            Absolute path to CSV file
 
+        packed : boolean
+            If True, networks are stored bit-packed
+
         Returns
         -------
         caspo.core.logicalnetwork.LogicalNetworkList
            Created object instance
         """
-        df = pd.read_csv(filename)
+        df = pd.read_csv(filename, nrows=0)
 
-        edges = set()
         mappings = []
         cols = []
         for m in df.columns:
             try:
-                ct = Mapping.from_str(m)
-                mappings.append(ct)
+                mappings.append(Mapping.from_str(m))
                 cols.append(m)
-                for source, sign in ct.clause:
-                    edges.add((source, ct.target, sign))
             except ValueError:
                 #current column isn't a mapping
                 pass
 
-        graph = Graph.from_tuples(edges)
-        hypergraph = HyperGraph.from_graph(graph)
-        hypergraph.mappings = mappings
+        hypergraph = HyperGraph.from_mappings(mappings)
+
+        if packed:
+            # rows are packed by chunks so that the whole binary matrix is never loaded
+            rows, nnet, scores = [], [], []
+            for chunk in pd.read_csv(filename, dtype=dict.fromkeys(cols, np.int8), chunksize=2**16):
+                rows.append(np.packbits(chunk[cols].values, axis=1, bitorder='little'))
+                if 'networks' in df.columns:
+                    nnet.append(chunk['networks'].values.astype(int))
+                else:
+                    nnet.append(np.ones(len(chunk), dtype=int))
+                scores.append(cls.__scores_from_dataframe(chunk))
+
+            if rows:
+                return cls.__from_rows(hypergraph, np.concatenate(rows), np.concatenate(nnet), True,
+                                       np.concatenate(scores))
+            else:
+                return cls(hypergraph, packed=True)
 
+        df = pd.read_csv(filename)
         if 'networks' in df.columns:
             nnet = df['networks'].values.astype(int)
         else:
             nnet = None
 
-        return cls(hypergraph, matrix=df[cols].values, networks=nnet)
+        return cls(hypergraph, matrix=df[cols].values, networks=nnet,
+                   scores=cls.__scores_from_dataframe(df))
+
+    @staticmethod
+    def __scores_from_dataframe(df):
+        """
+        Returns the scores of logical networks given in the columns `rss` and `mse` of a DataFrame
+        (if present)
+        """
+        scores = np.full((len(df), 2), np.nan)
+        for j, column in enumerate(['rss', 'mse']):
+            if column in df.columns:
+                scores[:, j] = df[column].values
+
+        return scores
+
+    @classmethod
+    def from_memmap(cls, path):
+        """
+        Opens a list of logical networks stored as memory-mapped files in the given directory, e.g.,
+        as created by :func:`from_hypergraph`. Networks appended to the list are written to them.
+
+        Parameters
+        ----------
+        path : str
+            Absolute path to the directory of the memory-mapped storage
+
+        Returns
+        -------
+        caspo.core.logicalnetwork.LogicalNetworkList
+           Created object instance
+        """
+        sidecar, matrix, _, _ = cls.__files(path)
+        with open(sidecar) as fd:
+            meta = json.load(fd)
+
+        hypergraph = HyperGraph.from_mappings([Mapping.from_str(m) for m in meta['mappings']])
+        nlist = cls(hypergraph, packed=meta['packed'])
+        nlist.__path = path
+
+        capacity = max(os.path.getsize(matrix) // max(1, nlist.__width()), 16)
+        nlist.__rows, nlist.__weights, nlist.__scores = nlist.__mmap(capacity)
+        nlist.__length = meta['length']
+
+        return nlist
 
     @classmethod
-    def from_hypergraph(cls, hypergraph, networks=None):
+    def from_hypergraph(cls, hypergraph, networks=None, packed=False, path=None):
         """
         Creates a list of logical networks from a given hypergraph and an
         optional list of :class:`caspo.core.logicalnetwork.LogicalNetwork` object instances
@@ -135,21 +535,39 @@ class LogicalNetworkList(object):
         networks : Optional[list]
             List of :class:`caspo.core.logicalnetwork.LogicalNetwork` object instances
 
+        packed : boolean
+            If True, networks are stored bit-packed
+
+        path : Optional[str]
+            If given, networks are stored as memory-mapped files in this directory (created if
+            needed), together with a sidecar file describing the mappings. Existing files are
+            overwritten. See :func:`from_memmap` to open them again.
+
         Returns
         -------
         caspo.core.logicalnetwork.LogicalNetworkList
            Created object instance
         """
+        if path is not None:
+            if not os.path.exists(path):
+                os.makedirs(path)
+
+            nlist = cls(hypergraph, packed=packed)
+            nlist.__path = path
+            nlist.__rows, nlist.__weights, nlist.__scores = nlist.__mmap(16)
+            for network in networks or []:
+                nlist.append(network)
+
+            nlist.flush()
+            return nlist
+
         matrix = None
         nnet = None
         if networks:
-            matrix = np.array([networks[0].to_array(hypergraph.mappings)])
-            nnet = [networks[0].networks]
-            for network in networks[1:]:
-                matrix = np.append(matrix, [network.to_array(hypergraph.mappings)], axis=0)
-                nnet.append(network.networks)
+            matrix = np.array([network.to_array(hypergraph.mappings) for network in networks])
+            nnet = [network.networks for network in networks]
 
-        return cls(hypergraph, matrix, nnet)
+        return cls(hypergraph, matrix, nnet, packed)
 
     def add_network(self, pos, network):
         """
@@ -162,14 +580,21 @@ class LogicalNetworkList(object):
         """
         :class:`caspo.core.mapping.MappingList`: the list of mappings present in at least one logical network in this list
         """
-        return self.hg.mappings[np.unique(np.where(self.__matrix == 1)[1])]
+        return self.hg.mappings[np.nonzero(self.__counts())[0]]
 
     def reset(self):
         """
-        Drop all networks in the list
+        Drop all networks in the list. A memory-mapped storage keeps its files and capacity, and new
+        networks overwrite the previous ones.
         """
-        self.__matrix = np.array([])
-        self.__networks = np.array([])
+        self.__length = 0
+        if self.__path is not None:
+            self.flush()
+        else:
+            dtype = np.uint8 if self.__packed else np.int8
+            self.__rows = np.zeros((0, self.__width()), dtype=dtype)
+            self.__weights = np.zeros(0, dtype=int)
+            self.__scores = np.zeros((0, 2))
 
     def split(self, indices):
         """
@@ -188,7 +613,10 @@ class LogicalNetworkList(object):
 
         .. seealso:: `numpy.split <http://docs.scipy.org/doc/numpy/reference/generated/numpy.split.html#numpy-split>`_
         """
-        return [LogicalNetworkList(self.hg, part) for part in np.split(self.__matrix, indices)]
+        parts = zip(np.split(self.__rows[:self.__length], indices),
+                    np.split(self.__scores[:self.__length], indices))
+        return [self.__from_rows(self.hg, part, np.ones(len(part), dtype=int), self.__packed,
+                                 scores) for part, scores in parts]
 
     def concat(self, other):
         """
@@ -210,8 +638,53 @@ class LogicalNetworkList(object):
             return self
         elif len(self) == 0:
             return other
+        networks = np.concatenate([self.__networks, other.__networks])
+        scores = np.concatenate([self.__scores[:self.__length], other.__scores[:other.__length]])
+        if self.__packed and other.__packed:
+            rows = np.concatenate([self.__rows[:self.__length], other.__rows[:other.__length]])
+            return self.__from_rows(self.hg, rows, networks, True, scores)
+        else:
+            matrix = np.append(self.__matrix, other.__matrix, axis=0)
+            return LogicalNetworkList(self.hg, matrix, networks, self.__packed, scores)
+
+    def reindex(self, hg):
+        """
+        Returns the same logical networks over another hypergraph having the same mappings, possibly
+        in a different order, e.g., the hypergraph of networks read from a file of another run.
+
+        Parameters
+        ----------
+        hg : :class:`caspo.core.hypergraph.HyperGraph`
+            Hypergraph having the same mappings as the underlying hypergraph
+
+        Returns
+        -------
+        caspo.core.logicalnetwork.LogicalNetworkList
+            Created object instance with columns in the order of mappings in the given hypergraph
+
+        Raises
+        ------
+        ValueError
+            If the given hypergraph has different mappings
+        """
+        index = dict((m, j) for j, m in enumerate(self.hg.mappings))
+        if len(hg.mappings) != len(index) or any(m not in index for m in hg.mappings):
+            raise ValueError("Logical networks cannot be reindexed over different logical mappings")
+
+        columns = np.array([index[m] for m in hg.mappings], dtype=int)
+        step = max(1, CHUNK_SIZE // max(1, len(columns)))
+        blocks = []
+        for start in range(0, self.__length, step):
+            block = self.__block(start, start + step)[:, columns]
+            blocks.append(np.packbits(block, axis=1, bitorder='little') if self.__packed else block)
+
+        if blocks:
+            rows = np.concatenate(blocks)
         else:
-            return LogicalNetworkList(self.hg, np.append(self.__matrix, other.__matrix, axis=0), np.concatenate([self.__networks, other.__networks]))
+            rows = np.zeros((0, self.__width()), dtype=np.uint8 if self.__packed else np.int8)
+
+        scores = self.__scores[:self.__length].copy()
+        return self.__from_rows(hg, rows, self.__networks.copy(), self.__packed, scores)
 
     def append(self, network):
         """
@@ -222,13 +695,12 @@ class LogicalNetworkList(object):
         network : :class:`caspo.core.logicalnetwork.LogicalNetwork`
             The network to append
         """
+        self.__reserve(1)
         arr = network.to_array(self.hg.mappings)
-        if len(self.__matrix):
-            self.__matrix = np.append(self.__matrix, [arr], axis=0)
-            self.__networks = np.append(self.__networks, network.networks)
-        else:
-            self.__matrix = np.array([arr])
-            self.__networks = np.array([network.networks])
+        self.__rows[self.__length] = np.packbits(arr, bitorder='little') if self.__packed else arr
+        self.__weights[self.__length] = network.networks
+        self.__scores[self.__length] = [network.graph.get(key, np.nan) for key in ['rss', 'mse']]
+        self.__length += 1
 
     def __len__(self):
         """
@@ -239,7 +711,7 @@ class LogicalNetworkList(object):
         int
             Number of logical networks
         """
-        return len(self.__matrix)
+        return self.__length
 
     def __iter__(self):
         """
@@ -250,8 +722,22 @@ class LogicalNetworkList(object):
         caspo.core.logicalnetwork.LogicalNetwork
             The next logical network in the list
         """
-        for i, arr in enumerate(self.__matrix):
-            yield LogicalNetwork(((clause, target) for clause, target in self.hg.mappings[np.where(arr == 1)[0]]), networks=self.__networks[i])
+        step = max(1, CHUNK_SIZE // max(1, len(self.hg.mappings)))
+        for start in range(0, self.__length, step):
+            for i, arr in enumerate(self.__block(start, start + step), start):
+                yield self.__network(i, arr)
+
+    def __network(self, i, arr):
+        """
+        Returns the logical network at position `i` given its binary array representation
+        """
+        attr = dict(networks=self.__networks[i])
+        for key, value in zip(['rss', 'mse'], self.__scores[i]):
+            if not np.isnan(value):
+                attr[key] = value
+
+        mappings = self.hg.mappings[np.where(arr == 1)[0]]
+        return LogicalNetwork(((clause, target) for clause, target in mappings), **attr)
 
 
     def __getitem__(self, index):
@@ -269,11 +755,130 @@ class LogicalNetworkList(object):
         object
             Either a :class:`caspo.core.logicalnetwork.LogicalNetwork` or a :class:`caspo.core.logicalnetwork.LogicalNetworkList` object
         """
-        matrix, networks = self.__matrix[index, :], self.__networks[index]
         if hasattr(index, '__iter__'):
-            return LogicalNetworkList(self.hg, matrix, networks)
+            return self.__from_rows(self.hg, self.__rows[:self.__length][index, :],
+                                    self.__networks[index], self.__packed,
+                                    self.__scores[:self.__length][index, :])
         else:
-            return LogicalNetwork(((clause, target) for clause, target in self.hg.mappings[np.where(matrix == 1)[0]]), networks=networks)
+            if self.__packed:
+                matrix = np.unpackbits(self.__rows[:self.__length][index],
+                                       count=len(self.hg.mappings), bitorder='little')
+            else:
+                matrix = self.__matrix[index, :]
+            return self.__network(range(self.__length)[index], matrix)
+
+    def simulate(self, clampings, readouts, n_jobs=-1):
+        """
+        Computes the predictions of all logical networks in the list for the given clampings. All
+        networks are simulated together as array operations over the underlying binary matrix.
+        Clauses are evaluated for all networks and clampings at once and disjunctions are reduced
+        over the mappings present in each network.
+
+        Parameters
+        ----------
+        clampings : iterable
+            Iterable over :class:`caspo.core.clamping.Clamping` object instances
+
+        readouts : list[str]
+            List of readouts names
+
+        n_jobs : int
+            Number of jobs to run in parallel over chunks of networks (Default to -1, all cores)
+
+        Returns
+        -------
+        `numpy.ndarray`_
+            3-D binary array with the predictions of each network (first axis), for each clamping
+            (second axis) over each readout (third axis)
+        """
+        program = __program__(self.hg.mappings)
+        clamped, values = self.__clampings(program, clampings)
+
+        return self.__simulate(program, clamped, values, readouts, n_jobs)
+
+    @staticmethod
+    def __clampings(program, clampings):
+        """
+        Returns two 2-D binary arrays (variables x clampings) telling whether each variable is
+        clamped and its value
+        """
+        clampings = list(clampings)
+
+        clamped = np.zeros((len(program['variables']), len(clampings)), dtype=bool)
+        values = np.zeros((len(program['variables']), len(clampings)), dtype=bool)
+        for j, clamping in enumerate(clampings):
+            for var, sign in clamping:
+                i = program['index'].get(var)
+                if i is not None:
+                    clamped[i, j] = True
+                    values[i, j] = sign == 1
+
+        return clamped, values
+
+    def __simulate(self, program, clamped, values, readouts, n_jobs):
+        """
+        Computes the predictions of all logical networks in the list using a bit-sliced encoding of
+        clampings. Each variable is given as a vector of bits over all clampings (packed in 64-bit
+        words) such that each logical operation evaluates 64 experimental conditions at once.
+
+        Parameters
+        ----------
+        program : dict
+            Compiled mappings of the underlying hypergraph
+
+        clamped : `numpy.ndarray`_
+            2-D binary array (variables x clampings) telling whether each variable is clamped
+
+        values : `numpy.ndarray`_
+            2-D binary array (variables x clampings) with the value of each clamped variable
+
+        readouts : list[str]
+            List of readouts names
+
+        n_jobs : int
+            Number of jobs to run in parallel over chunks of networks
+
+        Returns
+        -------
+        `numpy.ndarray`_
+            3-D binary array (networks x clampings x readouts)
+        """
+        parts = [part for _, part in
+                 self.__simulate_iter(program, clamped, values, readouts, n_jobs)]
+        if parts:
+            return np.concatenate(parts)
+
+        return np.zeros((0, clamped.shape[1], len(readouts)), dtype=np.int8)
+
+    def __simulate_iter(self, program, clamped, values, readouts, n_jobs):
+        """
+        Iterates over the predictions of consecutive chunks of logical networks in the list.
+        Parameters are the same as in :func:`__simulate`. Chunks are computed in parallel by batches
+        of `n_jobs` chunks.
+
+        Yields
+        ------
+        tuple[int,`numpy.ndarray`_]
+            The next tuple of the form (position of the first network in the chunk, 3-D binary array
+            with the chunk predictions)
+        """
+        nclampings = clamped.shape[1]
+        clamped, values = __pack__(clamped), __pack__(values)
+
+        step = max(1, CHUNK_SIZE // max(1, program['literals'].size * clamped.shape[1]))
+        starts = range(0, len(self), step)
+
+        def chunk(rows):
+            state = __fixpoint__(program, rows, clamped, values)
+            return __unpack__(__readouts__(program, rows, state, readouts), nclampings)
+
+        cpu = effective_n_jobs(n_jobs)
+        with Parallel(n_jobs=n_jobs, prefer='threads') as parallel:
+            for k in range(0, len(starts), cpu):
+                batch = starts[k:k+cpu]
+                parts = parallel(delayed(chunk)(self.__block(i, i+step)) for i in batch)
+                for i, part in zip(batch, parts):
+                    yield i, part
 
     def to_funset(self):
         """
@@ -294,11 +899,12 @@ class LogicalNetworkList(object):
             formulas = formulas.union(f for v, f in network.formulas_iter())
 
         formulas = pd.Series(list(formulas))
+        index = dict((f, i) for i, f in formulas.items())
 
         for i, network in enumerate(self):
             for v, f in network.formulas_iter():
                 fs.add(clingo.Function("formula", [clingo.Number(i),
-                    clingo.String(v), clingo.Number(int(formulas[formulas == f].index[0]))]))
+                    clingo.String(v), clingo.Number(index[f])]))
 
         for formula_idx, formula in formulas.items():
             for clause in formula:
@@ -312,7 +918,7 @@ class LogicalNetworkList(object):
 
         return fs
 
-    def to_dataframe(self, networks=False, dataset=None, size=False, n_jobs=-1):
+    def to_dataframe(self, networks=False, dataset=None, size=False, n_jobs=-1, mse=False):
         """
         Converts the list of logical networks to a `pandas.DataFrame`_ object instance
 
@@ -330,6 +936,10 @@ class LogicalNetworkList(object):
         n_jobs : int
             Number of jobs to run in parallel. Default to -1 (all cores available)
 
+        mse: boolean
+            If True and no dataset is given, a column with the MSE recorded for each logical network
+            (see :attr:`mse`) is included in the DataFrame without simulating the networks
+
         Returns
         -------
         `pandas.DataFrame`_
@@ -338,29 +948,27 @@ class LogicalNetworkList(object):
 
         .. _pandas.DataFrame: http://pandas.pydata.org/pandas-docs/stable/dsintro.html#dataframe
         """
-        length = len(self)
         df = pd.DataFrame(self.__matrix, columns=[str(m) for m in self.hg.mappings])
 
         if networks:
             df = pd.concat([df, pd.DataFrame({'networks': self.__networks})], axis=1)
 
         if dataset is not None:
-            clampings = dataset.clampings
-            readouts = dataset.readouts.columns
-            observations = dataset.readouts.values
-            pos = ~np.isnan(observations)
+            df = pd.concat([df, pd.DataFrame({'mse': self.__mse(dataset, n_jobs)})], axis=1)
 
-            mse = Parallel(n_jobs=n_jobs)(delayed(__parallel_mse__)(n, clampings, readouts, observations[pos], pos) for n in self)
-            df = pd.concat([df, pd.DataFrame({'mse': mse})], axis=1)
+        elif mse:
+            df = pd.concat([df, pd.DataFrame({'mse': self.mse})], axis=1)
 
         if size:
-            df = pd.concat([df, pd.DataFrame({'size': np.fromiter((n.size for n in self), int, length)})], axis=1)
+            df = pd.concat([df, pd.DataFrame({'size': self.sizes})], axis=1)
 
         return df
 
-    def to_csv(self, filename, networks=False, dataset=None, size=False, n_jobs=-1):
+    def to_csv(self, filename, networks=False, dataset=None, size=False, n_jobs=-1, chunksize=2**16,
+               mse=False):
         """
-        Writes the list of logical networks to a CSV file
+        Writes the list of logical networks to a CSV file. Networks are converted and written by
+        chunks.
 
         Parameters
         ----------
@@ -379,8 +987,17 @@ class LogicalNetworkList(object):
         n_jobs : int
             Number of jobs to run in parallel. Default to -1 (all cores available)
 
+        chunksize : int
+            Number of networks written at once
+
+        mse: boolean
+            If True and no dataset is given, a column with the MSE recorded for each logical network
+            is included
         """
-        self.to_dataframe(networks, dataset, size, n_jobs).to_csv(filename, index=False)
+        for start in range(0, max(len(self), 1), chunksize):
+            chunk = self[range(start, min(start + chunksize, len(self)))]
+            df = chunk.to_dataframe(networks, dataset, size, n_jobs, mse)
+            df.to_csv(filename, index=False, header=start == 0, mode='w' if start == 0 else 'a')
 
     def frequencies_iter(self):
         """
@@ -391,8 +1008,9 @@ class LogicalNetworkList(object):
         tuple[caspo.core.mapping.Mapping, float]
             The next pair (mapping,frequency)
         """
-        f = self.__matrix.mean(axis=0)
-        for i, m in self.mappings.items():
+        counts = self.__counts()
+        f = counts / float(self.__length)
+        for i, m in self.hg.mappings[np.nonzero(counts)[0]].items():
             yield m, f[i]
 
     def frequency(self, mapping):
@@ -414,7 +1032,11 @@ class LogicalNetworkList(object):
         ValueError
             If the given mapping is not found in the mappings of the underlying hypergraph of this list
         """
-        return self.__matrix[:, self.hg.mappings[mapping]].mean()
+        i = self.hg.mappings[mapping]
+        if self.__packed:
+            return ((self.__rows[:self.__length, i // 8] >> (i % 8)) & 1).mean()
+        else:
+            return self.__matrix[:, i].mean()
 
     def combinatorics(self):
         """
@@ -427,21 +1049,71 @@ class LogicalNetworkList(object):
             For each mapping key, the first dict has as value the set of mutually exclusive mappings while
             the second dict has as value the set of mutually inclusive mappings.
         """
-        f = self.__matrix.mean(axis=0)
-        candidates = np.where((f < 1) & (f > 0))[0]
+        counts = self.__counts()
+        candidates = np.where((counts < self.__length) & (counts > 0))[0]
         exclusive, inclusive = defaultdict(set), defaultdict(set)
-        for i, j in it.combinations(candidates, 2):
-            xor = np.logical_xor(self.__matrix[:, i], self.__matrix[:, j])
-            if xor.all():
-                exclusive[self.hg.mappings[i]].add(self.hg.mappings[j])
-                exclusive[self.hg.mappings[j]].add(self.hg.mappings[i])
+        if len(candidates) == 0:
+            return exclusive, inclusive
+
+        # Each candidate mapping is represented by the bitvector of networks having it. Two mappings
+        # are mutually inclusive if their bitvectors are equal and mutually exclusive if one is the
+        # complement of the other.
+        step = 8 * max(1, CHUNK_SIZE // (8 * max(1, len(self.hg.mappings))))
+        columns = np.concatenate([np.packbits(self.__block(i, i+step)[:, candidates].T, axis=1,
+                                              bitorder='little')
+                                  for i in range(0, self.__length, step)], axis=1)
+
+        complement = ~columns
+        complement[:, -1] &= (1 << (self.__length % 8 or 8)) - 1
+
+        groups = defaultdict(list)
+        for k, column in enumerate(columns):
+            groups[column.tobytes()].append(self.hg.mappings[candidates[k]])
+
+        for k, column in enumerate(columns):
+            mapping = self.hg.mappings[candidates[k]]
+            inclusive[mapping].update(m for m in groups[column.tobytes()] if m != mapping)
+            exclusive[mapping].update(groups.get(complement[k].tobytes(), []))
 
-            if (~xor).all():
-                inclusive[self.hg.mappings[i]].add(self.hg.mappings[j])
-                inclusive[self.hg.mappings[j]].add(self.hg.mappings[i])
+        inclusive = defaultdict(set, ((m, ms) for m, ms in inclusive.items() if ms))
+        exclusive = defaultdict(set, ((m, ms) for m, ms in exclusive.items() if ms))
 
         return exclusive, inclusive
 
+    def unique(self, keys=None):
+        """
+        Returns the list of logical networks without duplicates. Duplicated networks are compared on
+        the storage format (bit-packed or not), only the first occurrence of each network is kept
+        and the number of networks having the same behavior is summed up.
+
+        Parameters
+        ----------
+        keys : Optional[`numpy.ndarray`_]
+            If given, 2-D array with one row for each logical network such that networks are
+            considered duplicated if they have the same row, e.g., their input-output digests as
+            returned by :func:`signatures`
+
+        Returns
+        -------
+        caspo.core.logicalnetwork.LogicalNetworkList
+            Created object instance
+
+
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
+        """
+        rows = self.__rows[:self.__length]
+        if len(rows) == 0:
+            return self.__from_rows(self.hg, rows, self.__networks, self.__packed,
+                                    self.__scores[:0])
+
+        _, first, inverse = np.unique(rows if keys is None else keys, axis=0, return_index=True,
+                                      return_inverse=True)
+        order = np.argsort(first)
+        networks = np.bincount(inverse.reshape(-1), weights=self.__networks).astype(int)
+
+        scores = self.__scores[:self.__length][first[order]]
+        return self.__from_rows(self.hg, rows[first[order]], networks[order], self.__packed, scores)
+
     def predictions(self, setup, n_jobs=-1):
         """
         Returns a `pandas.DataFrame`_ with the weighted average predictions and variance of all readouts for each possible
@@ -466,22 +1138,94 @@ class LogicalNetworkList(object):
 
         .. seealso:: `Wikipedia: Weighted sample variance <https://en.wikipedia.org/wiki/Weighted_arithmetic_mean#Weighted_sample_variance>`_
         """
-        stimuli, inhibitors, readouts = setup.stimuli, setup.inhibitors, setup.readouts
-        nc = len(setup.cues())
-        predictions = np.zeros((len(self), 2**nc, len(setup)))
-        predictions[:, :, :] = Parallel(n_jobs=n_jobs)(delayed(__parallel_predictions__)(n, list(setup.clampings_iter(setup.cues())), readouts, stimuli, inhibitors) for n in self)
+        return self.predictions_aggregator(setup, n_jobs).to_dataframe()
 
-        avg = np.average(predictions[:, :, nc:], axis=0, weights=self.__networks)
-        var = np.average((predictions[:, :, nc:]-avg)**2, axis=0, weights=self.__networks)
+    def predictions_aggregator(self, setup, n_jobs=-1):
+        """
+        Returns a :class:`caspo.core.logicalnetwork.PredictionsAggregator` with the weighted average
+        predictions and variance of all readouts for each possible clamping in the given
+        experimental setup. Logical networks are simulated and aggregated by chunks, thus memory
+        usage does not depend on the number of logical networks in the list.
 
-        rcues = ["TR:%s" % c for c in setup.cues(True)]
-        cols = np.concatenate([rcues, ["AVG:%s" % r for r in readouts], ["VAR:%s" % r for r in readouts]])
+        Parameters
+        ----------
+        setup : :class:`caspo.core.setup.Setup`
+            Experimental setup
 
-        #use the first network predictions to extract all clampings
-        df = pd.DataFrame(np.concatenate([predictions[0, :, :nc], avg, var], axis=1), columns=cols)
-        df[rcues] = df[rcues].astype(int)
+        n_jobs : int
+            Number of jobs to run in parallel. Default to -1 (all cores available)
 
-        return df
+        Returns
+        -------
+        caspo.core.logicalnetwork.PredictionsAggregator
+            Aggregated predictions, e.g. use
+            :func:`caspo.core.logicalnetwork.PredictionsAggregator.to_csv` to write them by chunks
+        """
+        readouts = setup.readouts
+        inputs = setup.clampings_array(setup.cues())
+
+        program = __program__(self.hg.mappings)
+        clamped, values = self.__inputs(program, setup, inputs)
+
+        aggregator = PredictionsAggregator(inputs, setup.cues(True), readouts)
+        for i, part in self.__simulate_iter(program, clamped, values, readouts, n_jobs):
+            aggregator.update(part, self.__networks[i:i+len(part)])
+
+        return aggregator
+
+    def signatures(self, setup, n_jobs=-1):
+        """
+        Returns a digest of the input-output behavior of each logical network in the list, that is,
+        of its predictions over all readouts for each possible clamping in the given experimental
+        setup. Logical networks are simulated by chunks and two logical networks have the same
+        digest if and only if they have the same behavior (up to hash collisions).
+
+        Parameters
+        ----------
+        setup : :class:`caspo.core.setup.Setup`
+            Experimental setup
+
+        n_jobs : int
+            Number of jobs to run in parallel. Default to -1 (all cores available)
+
+        Returns
+        -------
+        `numpy.ndarray`_
+            2-D array (networks x 16 bytes) with the digest of each logical network
+
+
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
+        """
+        program = __program__(self.hg.mappings)
+        clamped, values = self.__inputs(program, setup, setup.clampings_array(setup.cues()))
+
+        signatures = np.zeros((len(self), 16), dtype=np.uint8)
+        for i, part in self.__simulate_iter(program, clamped, values, setup.readouts, n_jobs):
+            for j, bits in enumerate(np.packbits(part.reshape(len(part), -1), axis=1)):
+                digest = hashlib.blake2b(bits.tobytes(), digest_size=16).digest()
+                signatures[i+j] = np.frombuffer(digest, dtype=np.uint8)
+
+        return signatures
+
+    @staticmethod
+    def __inputs(program, setup, inputs):
+        """
+        Returns two 2-D binary arrays (variables x clampings) telling whether each variable is
+        clamped and its value for the given binary array of clampings over the setup cues (see
+        :func:`caspo.core.setup.Setup.clampings_array`)
+        """
+        clamped = np.zeros((len(program['variables']), len(inputs)), dtype=bool)
+        values = np.zeros((len(program['variables']), len(inputs)), dtype=bool)
+        for j, cue in enumerate(setup.cues()):
+            i = program['index'].get(cue)
+            if i is not None:
+                if cue in setup.stimuli:
+                    clamped[i] = True
+                    values[i] = inputs[:, j]
+                else:
+                    clamped[i] = inputs[:, j]
+
+        return clamped, values
 
     def weighted_mse(self, dataset, n_jobs=-1):
         """
@@ -501,15 +1245,52 @@ class LogicalNetworkList(object):
         float
             Weighted MSE
         """
-        predictions = np.zeros((len(self), len(dataset.clampings), len(dataset.setup.readouts)))
-        predictions[:, :, :] = Parallel(n_jobs=n_jobs)(delayed(__parallel_predictions__)(n, dataset.clampings, dataset.setup.readouts) for n in self)
-        for i, _ in enumerate(self):
-            predictions[i, :, :] *= self.__networks[i]
+        program = __program__(self.hg.mappings)
+        clamped, values = self.__clampings(program, dataset.conditions)
+
+        readouts = dataset.setup.readouts
+        total = np.zeros((clamped.shape[1], len(readouts)))
+        for i, part in self.__simulate_iter(program, clamped, values, readouts, n_jobs):
+            total += np.tensordot(self.__networks[i:i+len(part)], part, axes=1)
+
+        rows, cols, observed = dataset.observations
+        predictions = total / self.__networks.sum()
+
+        return mean_squared_error(observed, predictions[dataset.experiments[rows], cols])
+
+    def __mse(self, dataset, n_jobs):
+        """
+        Returns the MSE of each logical network with respect to the given dataset, simulating
+        networks by chunks. Replicated experiments are simulated only once.
+        """
+        program = __program__(self.hg.mappings)
+        clamped, values = self.__clampings(program, dataset.conditions)
+
+        rows, cols, observed = dataset.observations
+        rows = dataset.experiments[rows]
+
+        readouts = dataset.setup.readouts
+        mse = np.zeros(len(self))
+        for i, part in self.__simulate_iter(program, clamped, values, readouts, n_jobs):
+            mse[i:i+len(part)] = ((part[:, rows, cols] - observed)**2).mean(axis=1)
+
+        return mse
+
+    def score(self, dataset, n_jobs=-1):
+        """
+        Computes the MSE of each logical network with respect to the given
+        :class:`caspo.core.dataset.Dataset` object instance and records it (see :attr:`mse`). All
+        networks are simulated together by chunks.
 
-        readouts = dataset.readouts.values
-        pos = ~np.isnan(readouts)
+        Parameters
+        ----------
+        dataset: :class:`caspo.core.dataset.Dataset`
+            Dataset to compute MSE
 
-        return mean_squared_error(readouts[pos], (np.sum(predictions, axis=0) / np.sum(self.__networks))[pos])
+        n_jobs : int
+            Number of jobs to run in parallel. Default to -1 (all cores available)
+        """
+        self.__scores[:self.__length, 1] = self.__mse(dataset, n_jobs)
 
     def __plot__(self):
         """
@@ -526,7 +1307,7 @@ class LogicalNetworkList(object):
         graph = nx.MultiDiGraph()
         n_gates = 1
 
-        for mapping in self.hg.mappings[np.unique(np.where(self.__matrix == 1)[1])]:
+        for mapping in self.mappings:
             graph.add_node(mapping.target)
             if len(mapping.clause) > 1:
                 gate = 'gate-%s' % n_gates
@@ -544,6 +1325,227 @@ class LogicalNetworkList(object):
 
         return graph
 
+class PredictionsAggregator(object):
+    """
+    Streaming weighted average and variance of logical networks predictions for a list of clampings.
+    Predictions are given by chunks of logical networks and only the aggregated values are kept in
+    memory.
+
+    Parameters
+    ----------
+    inputs : `numpy.ndarray`_
+        2-D binary array describing each clamping (rows) over the given cues (columns)
+
+    cues : list[str]
+        List of cues names, with inhibitors renamed as in MIDAS files
+
+    readouts : list[str]
+        List of readouts names
+
+    Attributes
+    ----------
+    inputs : `numpy.ndarray`_
+    cues : list[str]
+    readouts : list[str]
+    weights : float
+        Sum of weights of all predictions aggregated so far
+
+    mean : `numpy.ndarray`_
+        2-D array with the weighted average of each readout (columns) for each clamping (rows)
+
+
+    .. seealso:: `Wikipedia: Algorithms for calculating variance <https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm>`_
+    """
+
+    def __init__(self, inputs, cues, readouts):
+        self.inputs = inputs
+        self.cues = list(cues)
+        self.readouts = list(readouts)
+
+        self.weights = 0.
+        self.mean = np.zeros((len(inputs), len(self.readouts)))
+        self._m2 = np.zeros((len(inputs), len(self.readouts)))
+
+    def update(self, predictions, weights):
+        """
+        Aggregates the predictions of a chunk of logical networks
+
+        Parameters
+        ----------
+        predictions : `numpy.ndarray`_
+            3-D array with the predictions of each network (first axis), for each clamping (second
+            axis) over each readout (third axis)
+
+        weights : `numpy.ndarray`_
+            1-D array with the weight of each network
+        """
+        weights = np.asarray(weights, dtype=float)
+        total = weights.sum()
+        if total == 0:
+            return
+
+        mean = np.tensordot(weights, predictions, axes=1) / total
+        m2 = np.tensordot(weights, (predictions - mean)**2, axes=1)
+
+        delta = mean - self.mean
+        weighted = self.weights + total
+        self.mean += delta * (total / weighted)
+        self._m2 += m2 + delta**2 * (self.weights * total / weighted)
+        self.weights = weighted
+
+    @property
+    def variance(self):
+        """
+        `numpy.ndarray`_: 2-D array with the weighted variance of each readout (columns) for each
+        clamping (rows)
+        """
+        return self._m2 / self.weights if self.weights else self._m2
+
+    def to_dataframe(self, start=0, stop=None):
+        """
+        Converts the aggregated predictions to a `pandas.DataFrame`_ object instance
+
+        Parameters
+        ----------
+        start : int
+            Position of the first clamping to include
+
+        stop : Optional[int]
+            Position after the last clamping to include. If None, all clampings from `start` are
+            included
+
+        Returns
+        -------
+        `pandas.DataFrame`_
+            DataFrame with the weighted average predictions and variance of all readouts for each
+            clamping
+
+
+        .. _pandas.DataFrame: http://pandas.pydata.org/pandas-docs/stable/dsintro.html#dataframe
+        """
+        rcues = ["TR:%s" % c for c in self.cues]
+        cols = np.concatenate([rcues, ["AVG:%s" % r for r in self.readouts],
+                               ["VAR:%s" % r for r in self.readouts]])
+
+        rows = slice(start, stop)
+        values = np.concatenate([self.inputs[rows], self.mean[rows], self.variance[rows]], axis=1)
+        df = pd.DataFrame(values, columns=cols)
+        df[rcues] = df[rcues].astype(int)
+
+        return df
+
+    def to_csv(self, filename, chunksize=2**16):
+        """
+        Writes the aggregated predictions to a CSV file by chunks of clampings
+
+        Parameters
+        ----------
+        filename : str
+            Absolute path where to write the CSV file
+
+        chunksize : int
+            Number of clampings written at once
+        """
+        for start in range(0, max(1, len(self.inputs)), chunksize):
+            df = self.to_dataframe(start, start + chunksize)
+            df.to_csv(filename, index=False, header=start == 0, mode='w' if start == 0 else 'a')
+
+class LogicalNetworkWriter(object):
+    """
+    Sink of logical networks writing them to a CSV file as they are appended. At most `buffersize`
+    networks are kept in memory, when the buffer is full networks are written to the file in the
+    same format as :func:`caspo.core.logicalnetwork.LogicalNetworkList.to_csv`.
+
+    Any object providing the methods :func:`append`, :func:`flush` and :func:`reset`, e.g., a
+    :class:`caspo.core.logicalnetwork.LogicalNetworkList` in memory or memory-mapped, can be used as
+    a sink of logical networks.
+
+    Parameters
+    ----------
+    hg : :class:`caspo.core.hypergraph.HyperGraph`
+        Underlying hypergraph of all logical networks
+
+    filename : str
+        Absolute path where to write the CSV file
+
+    networks : boolean
+        If True, a column with number of networks having the same behavior is included in the file
+
+    dataset: Optional[:class:`caspo.core.dataset.Dataset`]
+        If not None, a column with the MSE with respect to the given dataset is included
+
+    size: boolean
+        If True, a column with the size of each logical network is included
+
+    buffersize : int
+        Maximum number of networks kept in memory before writing them
+
+    mse: boolean
+        If True and no dataset is given, a column with the MSE recorded for each logical network is
+        included
+
+    Attributes
+    ----------
+    hg : :class:`caspo.core.hypergraph.HyperGraph`
+    filename : str
+    """
+
+    def __init__(self, hg, filename, networks=False, dataset=None, size=False, buffersize=2**12,
+                 mse=False):
+        self.hg = hg
+        self.filename = filename
+
+        self.__options = dict(networks=networks, dataset=dataset, size=size, n_jobs=1, mse=mse)
+        self.__buffersize = buffersize
+        self.__buffer = LogicalNetworkList.from_hypergraph(hg)
+        self.__written = 0
+
+        self.reset()
+
+    def append(self, network):
+        """
+        Appends a :class:`caspo.core.logicalnetwork.LogicalNetwork` to the sink. Buffered networks
+        are written if the buffer is full.
+
+        Parameters
+        ----------
+        network : :class:`caspo.core.logicalnetwork.LogicalNetwork`
+            The network to append
+        """
+        self.__buffer.append(network)
+        if len(self.__buffer) >= self.__buffersize:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered networks to the file
+        """
+        if len(self.__buffer):
+            with open(self.filename, 'a') as fd:
+                self.__buffer.to_dataframe(**self.__options).to_csv(fd, index=False, header=False)
+
+            self.__written += len(self.__buffer)
+            self.__buffer.reset()
+
+    def reset(self):
+        """
+        Drops all networks, the file is truncated to the CSV header
+        """
+        self.__buffer.reset()
+        self.__written = 0
+        self.__buffer.to_csv(self.filename, **self.__options)
+
+    def __len__(self):
+        """
+        Returns the number of logical networks appended to the sink, either written or buffered
+
+        Returns
+        -------
+        int
+            Number of logical networks
+        """
+        return self.__written + len(self.__buffer)
+
 class LogicalNetwork(nx.DiGraph):
     """
     Logical network class extends `networkx.DiGraph`_ with nodes being,
@@ -638,6 +1640,75 @@ class LogicalNetwork(nx.DiGraph):
 
         return ns
 
+    def __compile(self):
+        """
+        Compiles the logical network into integer-indexed formulas sorted in topological order.
+        The network is compiled once for each call to :func:`fixpoint` or :func:`predictions`, thus
+        the compiled program always reflects its current nodes and edges.
+
+        Returns
+        -------
+        tuple
+            A tuple (variables, index, formulas) where `variables` is the list of variables names in
+            topological order, `index` maps each variable name to its position in `variables` and
+            `formulas` is the list of pairs (position, clauses) with each clause given as a tuple of
+            pairs (position, expected value). If the network has a feedback-loop, None is returned.
+        """
+        dependencies = nx.DiGraph()
+        dependencies.add_nodes_from(sorted(self.variables()))
+        for clause, target in self.edges():
+            dependencies.add_edges_from((source, target) for source, _ in clause)
+
+        try:
+            variables = list(nx.topological_sort(dependencies))
+        except nx.NetworkXUnfeasible:
+            return None
+
+        index = dict((var, i) for i, var in enumerate(variables))
+        formulas = []
+        for i, var in enumerate(variables):
+            if self.has_node(var) and self.in_degree(var) > 0:
+                clauses = tuple(tuple((index[source], 1 if sign == 1 else 0)
+                                      for source, sign in clause)
+                                for clause, _ in self.in_edges(var))
+                formulas.append((i, clauses))
+
+        return (variables, index, formulas)
+
+    @staticmethod
+    def __sweep(program, clamping):
+        """
+        Evaluates a compiled program with respect to a given clamping in one sweep over the
+        variables in topological order.
+
+        Parameters
+        ----------
+        program : tuple
+            The compiled program as returned by :func:`__compile`
+
+        clamping : caspo.core.clamping.Clamping
+            A clamping over variables in the logical network
+
+        Returns
+        -------
+        list
+            The value of each variable in the same order as in the compiled program
+        """
+        variables, index, formulas = program
+        values = [0] * len(variables)
+        clamped = [False] * len(variables)
+        for var, sign in clamping:
+            i = index.get(var)
+            if i is not None:
+                values[i] = 1 if sign == 1 else 0
+                clamped[i] = True
+
+        for i, clauses in formulas:
+            if not clamped[i]:
+                values[i] = int(any(all(values[j] == v for j, v in clause) for clause in clauses))
+
+        return values
+
     def fixpoint(self, clamping, steps=0):
         """
         Computes the fixpoint with respect to a given :class:`caspo.core.clamping.Clamping`
@@ -653,11 +1724,25 @@ class LogicalNetwork(nx.DiGraph):
             e.g. a network with a negative feedback-loop, this will never end unless
             you provide a maximum number of steps.
 
+            If no maximum number of steps is given and the network has no feedback-loops,
+            the fixpoint is computed in one sweep over the variables in topological order.
+
         Returns
         -------
         dict
             The key-value mapping describing the state of the logical network
         """
+        program = self.__compile() if steps <= 0 else None
+        if program is not None:
+            return dict(zip(program[0], self.__sweep(program, clamping)))
+
+        return self.__iterate(clamping, steps)
+
+    def __iterate(self, clamping, steps):
+        """
+        Computes the fixpoint with respect to a given clamping by iterating synchronous steps over
+        the network, as described in :func:`fixpoint`
+        """
         current = dict.fromkeys(self.variables(), 0)
         updated = self.step(current, clamping)
         steps -= 1
@@ -704,6 +1789,12 @@ class LogicalNetwork(nx.DiGraph):
         nc = len(cues)
         ns = len(stimuli)
         predictions = np.zeros((nclampings if nclampings > 0 else len(clampings), nc+len(readouts)), dtype=np.int8)
+
+        program = self.__compile()
+        if program is not None:
+            positions = [(nc+j, program[1][readout]) for j, readout in enumerate(readouts)
+                         if readout in program[1]]
+
         for i, clamping in enumerate(clampings):
             if nc > 0:
                 arr = clamping.to_array(cues)
@@ -711,9 +1802,14 @@ class LogicalNetwork(nx.DiGraph):
                 arr[ns + np.where(arr[ns:] == -1)[0]] = 1
                 predictions[i, :nc] = arr
 
-            fixpoint = self.fixpoint(clamping)
-            for j, readout in enumerate(readouts):
-                predictions[i, nc+j] = fixpoint.get(readout, 0)
+            if program is not None:
+                values = self.__sweep(program, clamping)
+                for j, k in positions:
+                    predictions[i, j] = values[k]
+            else:
+                fixpoint = self.__iterate(clamping, 0)
+                for j, readout in enumerate(readouts):
+                    predictions[i, nc+j] = fixpoint.get(readout, 0)
 
         return pd.DataFrame(predictions, columns=np.concatenate([stimuli, [i+'i' for i in inhibitors], readouts]))
 
@@ -731,12 +1827,10 @@ class LogicalNetwork(nx.DiGraph):
         float
             Computed mean squared error
         """
-        clampings = dataset.clampings
-        readouts = dataset.readouts.columns
-        observations = dataset.readouts.values
-        pos = ~np.isnan(observations)
+        rows, cols, observed = dataset.observations
+        predictions = self.predictions(dataset.conditions, dataset.setup.readouts).values
 
-        return mean_squared_error(observations, (self.predictions(clampings, readouts).values)[pos])
+        return mean_squared_error(observed, predictions[dataset.experiments[rows], cols])
 
     def variables(self):
         """
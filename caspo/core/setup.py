@@ -17,8 +17,11 @@
 # -*- coding: utf-8 -*-
 
 import json
+import math
 import itertools as it
 
+import numpy as np
+
 import clingo
 
 from .clamping import Clamping
@@ -89,6 +92,38 @@ class Setup(object):
 
             yield Clamping(literals.items())
 
+    def clampings_array(self, cues=None):
+        """
+        Returns all possible clampings of this experimental setup as a binary array without creating
+        :class:`caspo.core.clamping.Clamping` object instances
+
+        Parameters
+        ----------
+        cues : Optional[iterable]
+            If given, restricts clampings over given species names
+
+        Returns
+        -------
+        `numpy.ndarray`_
+            2-D binary array where position `(i,j)` is 1 if the `j`-th cue is present (stimulated or
+            inhibited) in the `i`-th clamping yielded by :func:`clampings_iter`
+
+
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
+        """
+        s = cues or list(self.stimuli + self.inhibitors)
+        arr = np.zeros((2**len(s), len(s)), dtype=np.int8)
+
+        i = 1
+        for r in range(1, len(s) + 1):
+            n = math.comb(len(s), r)
+            combinations = it.chain.from_iterable(it.combinations(range(len(s)), r))
+            combinations = np.fromiter(combinations, dtype=int, count=n*r)
+            arr[np.arange(i, i + n)[:, np.newaxis], combinations.reshape(n, r)] = 1
+            i += n
+
+        return arr
+
     def to_funset(self):
         """
         Converts the experimental setup to a set of `clingo.Function`_ object instances
@@ -46,7 +46,7 @@ class Designer(object):
         setup : :class:`caspo.core.setup.Setup`
         candidates : :class:`caspo.core.clamping.ClampingList`
         designs : list[:class:`caspo.core.clamping.ClampingList`]
-        instance : str
+        instance : :class:`caspo.core.instance.Instance`
         encodings : dict
         stats : dict
     """
@@ -63,13 +63,14 @@ class Designer(object):
         else:
             fs.add(clingo.Function("mode", [clingo.Number(1)]))
 
-        self.instance = ". ".join(map(str, fs)) + ". #show clamped/3."
+        self.instance = core.Instance(fs, [('clamped', 3)])
 
         root = os.path.dirname(__file__)
         self.encodings = {
             'design': os.path.join(root, 'encodings/design/idesign.lp')
         }
         self.__optimum__ = None
+        self.__sat__ = None
 
         self.stats = {
             'time_optimum': None,
@@ -78,17 +79,26 @@ class Designer(object):
 
         self._logger = logging.getLogger("caspo")
 
-    def __save__(self, model):
+    def __design__(self, model):
         if self.__optimum__ == model.cost:
             clampings = []
             keyfunc = lambda i_v_s: i_v_s[0].number
             for _, c in it.groupby(sorted((f.arguments for f in model.symbols(shown=True)), key=keyfunc), keyfunc):
                 clampings.append(core.Clamping.from_tuples(((v.string, s.number) for _, v, s in c)))
 
-            self.designs.append(core.ClampingList(clampings))
+            return core.ClampingList(clampings)
         else:
             self.__optimum__ = model.cost
 
+    def __solve__(self, solver):
+        with solver.solve(yield_=True) as handle:
+            for model in handle:
+                design = self.__design__(model)
+                if design is not None:
+                    yield design
+
+            self.__sat__ = handle.get().satisfiable
+
     def design(self, max_stimuli=-1, max_inhibitors=-1, max_experiments=10, relax=False, configure=None):
         """
         Finds all optimal experimental designs using up to :attr:`max_experiments` experiments, such that each experiment has
@@ -123,13 +133,48 @@ class Designer(object):
 
         relax : boolean
             Whether to relax the full-pairwise networks discrimination (True) or not (False).
-            If relax equals True, the number of experiments per design is fixed to :attr:`max_experiments`
+            If relax equals True, the number of experiments per design is fixed to
+            :attr:`max_experiments`
 
         configure : callable
             Callable object responsible of setting clingo configuration
         """
-        self.designs = []
+        self.designs = list(self.iter_designs(max_stimuli, max_inhibitors, max_experiments, relax,
+                                              configure))
+
+        self._logger.info("%s optimal experimental designs found in %.4fs", len(self.designs), self.stats['time_enumeration'])
+
+    def iter_designs(self, max_stimuli=-1, max_inhibitors=-1, max_experiments=10, relax=False,
+                     configure=None):
+        """
+        Iterates over all optimal experimental designs as they are enumerated by the solver.
+        Parameters are the same as in :func:`design`. The enumeration is stopped if the iteration is
+        not continued.
+
+        Parameters
+        ----------
+        max_stimuli : int
+            Maximum number of stimuli per experiment
+
+        max_inhibitors : int
+            Maximum number of inhibitors per experiment
+
+        max_experiments : int
+            Maximum number of experiments per design
+
+        relax : boolean
+            Whether to relax the full-pairwise networks discrimination (True) or not (False).
+            If relax equals True, the number of experiments per design is fixed to
+            :attr:`max_experiments`
 
+        configure : callable
+            Callable object responsible of setting clingo configuration
+
+        Yields
+        ------
+        caspo.core.clamping.ClampingList
+            The next optimal experimental design
+        """
         args = ['-c maxstimuli=%s' % max_stimuli, '-c maxinhibitors=%s' % max_inhibitors, '-Wno-atom-undefined']
 
         solver = clingo.Control(args)
@@ -137,7 +182,7 @@ class Designer(object):
         if configure is not None:
             configure(solver.configuration)
 
-        solver.add("base", [], self.instance)
+        self.instance.load(solver)
         solver.load(self.encodings['design'])
 
         solver.ground([("base", [])])
@@ -147,7 +192,8 @@ class Designer(object):
             parts.append(("diff", [clingo.Number(max_experiments + 1)]))
 
             solver.ground(parts)
-            solver.solve(on_model=self.__save__)
+            for design in self.__solve__(solver):
+                yield design
         else:
             step, sat = 0, False
             while step <= max_experiments and not sat:
@@ -162,9 +208,10 @@ class Designer(object):
                 solver.ground(parts)
                 solver.assign_external(clingo.Function("query",
                     [clingo.Number(step)]), True)
-                sat, step = solver.solve(on_model=self.__save__).satisfiable, step + 1
+                for design in self.__solve__(solver):
+                    yield design
+
+                sat, step = self.__sat__, step + 1
 
         self.stats['time_optimum'] = solver.statistics['summary']['times']['solve']
         self.stats['time_enumeration'] = solver.statistics['summary']['times']['total']
-
-        self._logger.info("%s optimal experimental designs found in %.4fs", len(self.designs), self.stats['time_enumeration'])
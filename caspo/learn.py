@@ -16,9 +16,9 @@
 # along with caspo.  If not, see <http://www.gnu.org/licenses/>.import random
 # -*- coding: utf-8 -*-
 
-import math
 import os
 import logging
+import timeit
 from functools import partial
 from random import randint
 
@@ -51,6 +51,10 @@ class Learner(object):
     factor : int
         Discretization factor, e.g. 10, 100, 1000
 
+    cache : Optional[str]
+        Absolute path to a directory where expanded hypergraphs are cached (see
+        :func:`caspo.core.hypergraph.HyperGraph.from_graph`)
+
     Attributes
     ----------
         graph : :class:`caspo.core.graph.Graph`
@@ -59,24 +63,29 @@ class Learner(object):
         factor : int
         discrete : str
         hypergraph : :class:`caspo.core.hypergraph.HyperGraph`
-        instance : str
+        instance : :class:`caspo.core.instance.Instance`
         optimum : :class:`caspo.core.logicalnetwork.LogicalNetwork`
         networks : :class:`caspo.core.logicalnetwork.LogicalNetworkList`
+            Sink of enumerated logical networks. It can be replaced by any object providing the
+            methods `append`, `flush` and `reset`, e.g., a
+            :class:`caspo.core.logicalnetwork.LogicalNetworkWriter` to stream networks to disk
         encodings : dict
         stats : dict
     """
-    def __init__(self, graph, dataset, length, discrete, factor):
+    def __init__(self, graph, dataset, length, discrete, factor, cache=None):
         self.graph = graph
         self.dataset = dataset
         self.length = length
         self.factor = factor
         self.discrete = partial(self.__getattribute__(discrete), factor)
 
-        self.hypergraph = core.HyperGraph.from_graph(self.graph, length)
+        self.hypergraph = core.HyperGraph.from_graph(self.graph, length, cache)
 
-        fs = self.dataset.to_funset(self.discrete).union(self.hypergraph.to_funset())
+        # hyperedges that cannot be used with the experimental setup are not given to the solver
+        hyper = self.hypergraph.relevant(self.dataset.setup)
+        fs = self.dataset.to_funset(self.discrete).union(self.hypergraph.to_funset(hyper))
         fs.add(clingo.Function('dfactor', [clingo.Number(self.factor)]))
-        self.instance = ". ".join(map(str, fs)) + ". #show dnf/2."
+        self.instance = core.Instance(fs, [('dnf', 2)])
 
         self.optimum = None
         self.networks = core.LogicalNetworkList.from_hypergraph(self.hypergraph)
@@ -95,9 +104,12 @@ class Learner(object):
             'time_optimum': None,
             'time_enumeration': None,
             'optimum_mse': None,
-            'optimum_size': None
+            'optimum_size': None,
+            'optimum_rss': None,
+            'weighted_mse': None
         }
 
+        self._tolerance = None
         self._last = None
         self._logger = logging.getLogger("caspo")
 
@@ -111,15 +123,18 @@ class Learner(object):
         factor : int
             The factor to be used for the discretization
 
-        value : float
-            The value to be discretized
+        value : float or `numpy.ndarray`_
+            The value (or values) to be discretized
 
         Returns
         -------
-        int
-            The discretized value
+        int or `numpy.ndarray`_
+            The discretized value (or values)
+
+
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
         """
-        return int(round(factor*value))
+        return np.rint(factor*value).astype(int)
 
     @staticmethod
     def ceil(factor, value):
@@ -131,15 +146,18 @@ class Learner(object):
         factor : int
             The factor to be used for the discretization
 
-        value : float
-            The value to be discretized
+        value : float or `numpy.ndarray`_
+            The value (or values) to be discretized
 
         Returns
         -------
-        int
-            The discretized value
+        int or `numpy.ndarray`_
+            The discretized value (or values)
+
+
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
         """
-        return int(math.ceil(factor*value))
+        return np.ceil(factor*value).astype(int)
 
     @staticmethod
     def floor(factor, value):
@@ -151,28 +169,34 @@ class Learner(object):
         factor : int
             The factor to be used for the discretization
 
-        value : float
-            The value to be discretized
+        value : float or `numpy.ndarray`_
+            The value (or values) to be discretized
 
         Returns
         -------
-        int
-            The discretized value
+        int or `numpy.ndarray`_
+            The discretized value (or values)
+
+
+        .. _numpy.ndarray: http://docs.scipy.org/doc/numpy/reference/generated/numpy.ndarray.html#numpy.ndarray
         """
-        return int(math.floor(factor*value))
+        return np.floor(factor*value).astype(int)
 
     def __keep_last__(self, model):
         self.last = model.symbols(shown=True)
 
+    def __network__(self, symbols):
+        tuples = (f.arguments for f in symbols if f.name == 'dnf')
+        tuples = ((i.number, j.number) for i, j in tuples)
+        return core.LogicalNetwork.from_hypertuples(self.hypergraph, tuples)
+
     def __save__(self, model):
-        tuples = (f.arguments for f in model.symbols(shown=True))
-        network = core.LogicalNetwork.from_hypertuples(self.hypergraph, ((i.number, j.number) for i, j in tuples))
-        self.networks.append(network)
+        self.networks.append(self.__network__(model.symbols(shown=True)))
 
     def __get_clingo__(self, encodings, args=None):
         solver = clingo.Control(args or [])
 
-        solver.add("base", [], self.instance)
+        self.instance.load(solver)
         for enc in encodings:
             solver.load(self.encodings[enc])
 
@@ -180,9 +204,12 @@ class Learner(object):
 
     def learn(self, fit=0, size=0, configure=None):
         """
-        Learns all (nearly) optimal logical networks with give fitness and size tolerance.
-        The first optimum logical network found is saved in the attribute :attr:`optimum` while
-        all enumerated logical networks are saved in the attribute :attr:`networks`.
+        Learns all (nearly) optimal logical networks with give fitness and size tolerance. The first
+        optimum logical network found is saved in the attribute :attr:`optimum` while all enumerated
+        logical networks are appended, as soon as they are found, to the attribute :attr:`networks`.
+        If networks are kept in a :class:`caspo.core.logicalnetwork.LogicalNetworkList`, the MSE of
+        each network and the weighted MSE (see :attr:`stats`) are computed once enumeration is over
+        by simulating all networks together.
 
         Example::
 
@@ -208,49 +235,180 @@ class Learner(object):
         configure : callable
             Callable object responsible of setting a custom clingo configuration
         """
-        encodings = ['guess', 'fixpoint', 'rss']
-        if self.optimum is None:
-            solver = self.__get_clingo__(encodings + ['opt'])
-            if configure is not None:
-                configure(solver.configuration)
+        self.networks.reset()
+        self._tolerance = (fit, size)
+        for network in self.iter_networks(fit, size, configure):
+            self.networks.append(network)
+
+        if isinstance(self.networks, core.LogicalNetworkList) and len(self.networks):
+            self.networks.score(self.dataset)
+            self.stats['weighted_mse'] = self.networks.weighted_mse(self.dataset)
+
+        self.networks.flush()
+        self._logger.info("%s (nearly) optimal logical networks learned in %.4fs", len(self.networks), self.stats['time_enumeration'])
+
+    def sweep(self, tolerances, configure=None):
+        """
+        Learns all (nearly) optimal logical networks for several fitness and size tolerances solving
+        only once. Logical networks are enumerated for the loosest tolerance and the family for each
+        given tolerance is obtained by filtering networks according to the residual sum of squares
+        and size recorded for each of them. The family for the loosest tolerance is saved in the
+        attribute :attr:`networks`.
+
+        Example::
+
+            >>> families = learner.sweep([(0, 0), (0.02, 1), (0.05, 2)])
+
+        Parameters
+        ----------
+        tolerances : list[(float,int)]
+            List of tuples of the form (fitness tolerance, size tolerance)
+
+        configure : callable
+            Callable object responsible of setting a custom clingo configuration
+
+        Returns
+        -------
+        list[:class:`caspo.core.logicalnetwork.LogicalNetworkList`]
+            The family of logical networks for each tolerance
+
+        Raises
+        ------
+        ValueError
+            If networks are appended to a sink other than a
+            :class:`caspo.core.logicalnetwork.LogicalNetworkList`
+        """
+        if not isinstance(self.networks, core.LogicalNetworkList):
+            raise ValueError("Logical networks written to a sink cannot be filtered")
+
+        tolerances = list(tolerances)
+        fit, size = max(fit for fit, _ in tolerances), max(size for _, size in tolerances)
+        self.learn(fit, size, configure)
+
+        return [self.filter(fit, size) for fit, size in tolerances]
+
+    def filter(self, fit=0, size=0):
+        """
+        Returns the (nearly) optimal logical networks for the given fitness and size tolerance among
+        those learned in the last call to :func:`learn`, without solving again. The given tolerance
+        must not be looser than the one used for learning.
+
+        Parameters
+        ----------
+        fit : float
+            Fitness tolerance, e.g., use 0.1 for 10% tolerance with respect to the optimum
+
+        size : int
+            Size tolerance with respect to the optimum
 
-            solver.ground([("base", [])])
+        Returns
+        -------
+        caspo.core.logicalnetwork.LogicalNetworkList
+            The logical networks within the given tolerance
+
+        Raises
+        ------
+        ValueError
+            If no networks have been learned, the given tolerance is looser than the one used for
+            learning or networks have been appended to a sink other than a
+            :class:`caspo.core.logicalnetwork.LogicalNetworkList`
+        """
+        if self._tolerance is None or fit > self._tolerance[0] or size > self._tolerance[1]:
+            raise ValueError("Tolerance (%s, %s) is not covered by the learned logical networks"
+                             % (fit, size))
+
+        if not isinstance(self.networks, core.LogicalNetworkList):
+            raise ValueError("Logical networks written to a sink cannot be filtered")
+
+        rss = self.stats['optimum_rss']
+        maxrss, maxsize = int(rss + rss*fit), self.stats['optimum_size'] + size
+
+        selected = (self.networks.rss <= maxrss) & (self.networks.sizes <= maxsize)
+        return self.networks[np.where(selected)[0]]
+
+    def iter_networks(self, fit=0, size=0, configure=None):
+        """
+        Iterates over all (nearly) optimal logical networks with give fitness and size tolerance as
+        they are enumerated by the solver. The first optimum logical network found is saved in the
+        attribute :attr:`optimum` before enumeration starts. The enumeration is stopped if the
+        iteration is not continued, e.g., to keep only the first k networks.
+
+        Example::
+
+            >>> import itertools
+            >>> first = list(itertools.islice(learner.iter_networks(0.02, 1), 10))
+
+        Parameters
+        ----------
+        fit : float
+            Fitness tolerance, e.g., use 0.1 for 10% tolerance with respect to the optimum
+
+        size : int
+            Size tolerance with respect to the optimum
+
+        configure : callable
+            Callable object responsible of setting a custom clingo configuration
+
+        Yields
+        ------
+        caspo.core.logicalnetwork.LogicalNetwork
+            The next (nearly) optimal logical network. Its residual sum of squares (discretized) is
+            given in the graph attribute `rss`
+        """
+        solver = self.__get_clingo__(['guess', 'fixpoint', 'rss', 'opt', 'enum'])
+        if configure is not None:
+            configure(solver.configuration)
+
+        solver.ground([("base", [])])
+
+        if self.optimum is None:
             solver.solve(on_model=self.__keep_last__)
 
             self.stats['time_optimum'] = solver.statistics['summary']['times']['total']
 
             self._logger.info("Optimum logical network learned in %.4fs", self.stats['time_optimum'])
 
-            tuples = (f.arguments for f in self.last)
-            self.optimum = core.LogicalNetwork.from_hypertuples(self.hypergraph, ((i.number, j.number) for i, j in tuples))
+            self.optimum = self.__network__(self.last)
 
-        predictions = self.optimum.predictions(self.dataset.clampings, self.dataset.readouts.columns).values
+        readouts = self.dataset.setup.readouts
+        predictions = self.optimum.predictions(self.dataset.conditions, readouts).values
 
-        readouts = self.dataset.readouts.values
-        pos = ~np.isnan(readouts)
+        rows, cols, observed = self.dataset.observations
+        rows = self.dataset.experiments[rows]
 
-        rss = np.sum((np.vectorize(self.discrete)(readouts[pos]) - predictions[pos]*self.factor)**2)
+        discrete = self.discrete(observed)
+        rss = np.sum((discrete - predictions[rows, cols]*self.factor)**2)
 
+        # the residual cost of each model is its RSS minus the lowest possible RSS of observations
+        offset = np.sum(np.minimum(discrete**2, (self.factor - discrete)**2))
 
-        self.stats['optimum_mse'] = mean_squared_error(readouts[pos], predictions[pos])
+        self.stats['optimum_mse'] = mean_squared_error(observed, predictions[rows, cols])
         self.stats['optimum_size'] = self.optimum.size
+        self.stats['optimum_rss'] = int(rss)
 
         self._logger.info("Optimum logical networks has MSE %.4f and size %s", self.stats['optimum_mse'], self.stats['optimum_size'])
 
-        self.networks.reset()
-
-        args = ['-c maxrss=%s' % int(rss + rss*fit), '-c maxsize=%s' % (self.optimum.size + size)]
-
-        solver = self.__get_clingo__(encodings + ['enum'], args)
+        # the program grounded for the optimization is reused: only the bounds are grounded and
+        # optimization statements are only used to compute the cost of each model (opt_mode=enum)
+        maxrss, maxsize = int(rss + rss*fit), self.optimum.size + size
+        solver.ground([("enumeration", [clingo.Number(maxrss), clingo.Number(maxsize)])])
+        solver.configuration.solve.opt_mode = 'enum,%d,%d' % (maxrss - offset, maxsize)
         solver.configuration.solve.models = '0'
-        if configure is not None:
-            configure(solver.configuration)
 
-        solver.ground([("base", [])])
-        solver.solve(on_model=self.__save__)
+        # the enumeration is timed on its own since the solver has already been used for the
+        # optimization. The time spent by the caller on each yielded network is not counted.
+        elapsed = 0.
+        start = timeit.default_timer()
+        with solver.solve(yield_=True) as handle:
+            for model in handle:
+                network = self.__network__(model.symbols(shown=True))
+                network.graph['rss'] = int(offset + model.cost[0])
 
-        self.stats['time_enumeration'] = solver.statistics['summary']['times']['total']
-        self._logger.info("%s (nearly) optimal logical networks learned in %.4fs", len(self.networks), self.stats['time_enumeration'])
+                elapsed += timeit.default_timer() - start
+                yield network
+                start = timeit.default_timer()
+
+        self.stats['time_enumeration'] = elapsed + timeit.default_timer() - start
 
     def random(self, size, n_and, max_in, n=1):
         """
@@ -284,3 +442,4 @@ class Learner(object):
 
         solver.ground([("base", [])])
         solver.solve(on_model=self.__save__)
+        self.networks.flush()
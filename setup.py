@@ -55,7 +55,8 @@ setup(name=find_meta("package"),
                    "Intended Audience :: Healthcare Industry",
                    "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",
                    "Operating System :: OS Independent",
-                   "Programming Language :: Python :: 2.7",
+                   "Programming Language :: Python :: 3",
+                   "Programming Language :: Python :: 3 :: Only",
                    "Topic :: Scientific/Engineering :: Artificial Intelligence",
                    "Topic :: Scientific/Engineering :: Bio-Informatics"
                    ],
@@ -64,6 +65,7 @@ setup(name=find_meta("package"),
       packages=find_packages(exclude=['ez_setup', 'examples', 'tests']),
       include_package_data=True,
       zip_safe=False,
+      python_requires='>=3.8',
       entry_points={
           'console_scripts': [
               'caspo=caspo.console.main:run',